@@ -525,7 +525,9 @@ class FusionTranscript(PreTranscript):
         if len(breakpoint) > 1:
             raise AttributeError('cannot pull exons on non-specific breakpoints')
         new_exons = []
-        s = ''
+        # collect the sequence pieces as str and join once rather than growing a sequence object
+        pieces = []
+        length = 0
         exons = sorted(transcript.exons, key=lambda x: x.start)
         if breakpoint.orient == ORIENT.LEFT:  # five prime
             for i, exon in enumerate(exons):
@@ -533,28 +535,31 @@ class FusionTranscript(PreTranscript):
                 intact_end_splice = True
                 if breakpoint.start < exon.start:  # =====----|----|----
                     if i > 0:  # add intron
-                        temp = reference_sequence[exons[i - 1].end : breakpoint.start]
-                        s += temp
+                        temp = str(reference_sequence[exons[i - 1].end : breakpoint.start])
+                        pieces.append(temp)
+                        length += len(temp)
                     break
                 else:
                     if i > 0:  # add intron
-                        temp = reference_sequence[exons[i - 1].end : exon.start - 1]
-                        s += temp
+                        temp = str(reference_sequence[exons[i - 1].end : exon.start - 1])
+                        pieces.append(temp)
+                        length += len(temp)
                     if breakpoint.start <= exon.end_splice_site.end:
                         intact_end_splice = False
                     if breakpoint.start <= exon.start_splice_site.end:
                         intact_start_splice = False
                     t = min(breakpoint.start, exon.end)
                     e = Exon(
-                        len(s) + 1,
-                        len(s) + t - exon.start + 1,
+                        length + 1,
+                        length + t - exon.start + 1,
                         intact_start_splice=intact_start_splice,
                         intact_end_splice=intact_end_splice,
                         strand=STRAND.POS,
                     )
-                    temp = reference_sequence[exon.start - 1 : t]
-                    e.seq = str(temp)
-                    s += temp
+                    temp = str(reference_sequence[exon.start - 1 : t])
+                    e.seq = temp
+                    pieces.append(temp)
+                    length += len(temp)
                     new_exons.append((e, exon))
         elif breakpoint.orient == ORIENT.RIGHT:  # three prime
             for i, exon in enumerate(exons):
@@ -564,42 +569,46 @@ class FusionTranscript(PreTranscript):
                 if breakpoint.start < exon.start:  # --==|====|====
                     if i > 0:  # add last intron
                         t = max(exons[i - 1].end + 1, breakpoint.start)
-                        temp = reference_sequence[t - 1 : exon.start - 1]
-                        s += temp
+                        temp = str(reference_sequence[t - 1 : exon.start - 1])
+                        pieces.append(temp)
+                        length += len(temp)
                     if Interval.overlaps(breakpoint, exon.start_splice_site):
                         intact_start_splice = False
                     # add the exon
                     e = Exon(
-                        len(s) + 1,
-                        len(s) + len(exon),
+                        length + 1,
+                        length + len(exon),
                         intact_start_splice=intact_start_splice,
                         intact_end_splice=intact_end_splice,
                         strand=STRAND.POS,
                     )
-                    temp = reference_sequence[exon.start - 1 : exon.end]
-                    e.seq = str(temp)
+                    temp = str(reference_sequence[exon.start - 1 : exon.end])
+                    e.seq = temp
 
                     assert len(temp) == len(e)
-                    s += temp
+                    pieces.append(temp)
+                    length += len(temp)
                     new_exons.append((e, exon))
                 elif breakpoint.start <= exon.end:  # --|-====|====
                     intact_start_splice = False
-                    temp = reference_sequence[breakpoint.start - 1 : exon.end]
+                    temp = str(reference_sequence[breakpoint.start - 1 : exon.end])
                     if Interval.overlaps(breakpoint, exon.end_splice_site):
                         intact_end_splice = False
                     # add the exon
                     e = Exon(
-                        len(s) + 1,
-                        len(s) + len(temp),
+                        length + 1,
+                        length + len(temp),
                         intact_start_splice=intact_start_splice,
                         intact_end_splice=intact_end_splice,
                         strand=STRAND.POS,
                     )
-                    e.seq = str(temp)
-                    s += temp
+                    e.seq = temp
+                    pieces.append(temp)
+                    length += len(temp)
                     new_exons.append((e, exon))
         else:
             raise NotSpecifiedError('breakpoint orientation must be specified to pull exons')
+        s = ''.join(pieces)
         if transcript.get_strand() == STRAND.NEG:
             # reverse complement the sequence and reverse the exons
             temp = new_exons
@@ -607,8 +616,8 @@ class FusionTranscript(PreTranscript):
 
             for ex, old_exon in temp[::-1]:
                 e = Exon(
-                    len(s) - ex.end + 1,
-                    len(s) - ex.start + 1,
+                    length - ex.end + 1,
+                    length - ex.start + 1,
                     intact_start_splice=ex.end_splice_site.intact,
                     intact_end_splice=ex.start_splice_site.intact,
                     strand=STRAND.POS,
@@ -618,4 +627,4 @@ class FusionTranscript(PreTranscript):
         elif transcript.get_strand() != STRAND.POS:
             raise NotSpecifiedError('transcript strand must be specified to pull exons')
 
-        return str(s), new_exons
+        return s, new_exons
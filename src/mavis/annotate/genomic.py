@@ -1,4 +1,4 @@
-import itertools
+from bisect import bisect_left
 from typing import Dict, List, Optional, Tuple
 
 from ..constants import ORIENT, STRAND, reverse_complement
@@ -330,7 +330,8 @@ class PreTranscript(BioInterval):
         for ex in self.exons:
             if ex.end > self.end or ex.start < self.start:
                 raise AssertionError('exon is outside transcript', self, ex)
-        for e1, e2 in itertools.combinations(self.exons, 2):
+        # exons are sorted by start so any overlap implies an overlap between neighbours
+        for e1, e2 in zip(self.exons, self.exons[1:]):
             if Interval.overlaps(e1, e2):
                 raise AttributeError('exons cannot overlap')
 
@@ -511,16 +512,22 @@ class PreTranscript(BioInterval):
         Raises:
             AttributeError: if the strand is not given or the exon does not belong to the transcript
         """
-        for i, current_exon in enumerate(self.exons):
-            if exon != current_exon:
-                continue
-            if self.get_strand() == STRAND.POS:
-                return i + 1
-            elif self.get_strand() == STRAND.NEG:
-                return len(self.exons) - i
+        # exons are kept sorted by start so bisect to the candidate before comparing keys, which is
+        # expensive. Collecting the starts is still linear but only reads an attribute per exon. The
+        # starts are not cached since fusion transcripts append exons after construction, so fall
+        # back to a full scan if the list has been reordered
+        index = bisect_left([e.start for e in self.exons], exon.start)
+        if index >= len(self.exons) or exon != self.exons[index]:
+            for index, current_exon in enumerate(self.exons):
+                if exon == current_exon:
+                    break
             else:
-                raise NotSpecifiedError('strand must be pos or neg to calculate the exon number')
-        raise AttributeError('can only calculate phase on associated exons')
+                raise AttributeError('can only calculate phase on associated exons')
+        if self.get_strand() == STRAND.POS:
+            return index + 1
+        elif self.get_strand() == STRAND.NEG:
+            return len(self.exons) - index
+        raise NotSpecifiedError('strand must be pos or neg to calculate the exon number')
 
     def get_seq(
         self, reference_genome: Optional[ReferenceGenome] = None, ignore_cache: bool = False
@@ -100,8 +100,9 @@ def draw(
                 ann.annotation_id, ann.break1.chr, ann.break2.chr, gene_aliases1, gene_aliases2
             )
 
-            drawing = os.path.join(drawings_directory, name + '.svg')
-            legend = os.path.join(drawings_directory, name + '.legend.json')
+            drawing_prefix = os.path.join(drawings_directory, name)
+            drawing = drawing_prefix + '.svg'
+            legend = drawing_prefix + '.legend.json'
             logger.info(f'generating svg: {drawing}')
             canvas.saveas(drawing)
 
@@ -1,4 +1,5 @@
 import itertools
+from operator import eq
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 from ..constants import CODON_SIZE, START_AA, STOP_AA, translate
@@ -28,22 +29,17 @@ def calculate_orf(
     cds_orfs = []  # (cds_start, cds_end)
     for offset in range(0, CODON_SIZE):
         aa_sequence = translate(spliced_cdna_sequence, offset)
-        # now calc the open reading frames
-        orf_intervals = []
-        current_start = None
-        for i, curr_amino_acid in enumerate(aa_sequence):
-            if curr_amino_acid == START_AA:
-                pos = i * CODON_SIZE + 1 + offset
-                if current_start is None:
-                    current_start = pos
-            elif curr_amino_acid == STOP_AA:
-                pos = (i + 1) * CODON_SIZE + offset
-                if current_start is not None:  # close the current interval
-                    itvl = Interval(current_start, pos)
-                    if min_orf_size is None or len(itvl) >= min_orf_size:
-                        orf_intervals.append(itvl)
-                    current_start = None
-        cds_orfs.extend(orf_intervals)
+        # now calc the open reading frames. each orf runs from the first start after the previous
+        # orf to the next stop codon, so jump between them with str.find instead of a per-codon loop
+        start = aa_sequence.find(START_AA)
+        while start >= 0:
+            stop = aa_sequence.find(STOP_AA, start)
+            if stop < 0:
+                break
+            itvl = Interval(start * CODON_SIZE + 1 + offset, (stop + 1) * CODON_SIZE + offset)
+            if min_orf_size is None or len(itvl) >= min_orf_size:
+                cds_orfs.append(itvl)
+            start = aa_sequence.find(START_AA, stop)
     return cds_orfs
 
 
@@ -197,15 +193,16 @@ class Domain:
 
         results = []
         last_min_end = 0
+        # matching is case-insensitive so normalize the case once rather than per compared residue
+        input_upper = input_sequence.upper()
         for seq in seq_list:
             # align the current sequence to find the best matches
             scores = []
             min_match = max(1, int(round(len(seq) * min_region_match, 0)))
+            seq_upper = seq.upper()
             for pos in range(last_min_end, len(input_sequence) - len(seq) + 1):
-                score = 0
-                for i in range(0, len(seq)):
-                    if input_sequence[pos + i].upper() == seq[i].upper():
-                        score += 1
+                # count identical residues without a per-residue branch (True counts as 1)
+                score = sum(map(eq, input_upper[pos : pos + len(seq)], seq_upper))
                 if score > min_match:
                     scores.append((Interval(pos + 1, pos + len(seq)), score))
             if not scores:
@@ -274,6 +271,8 @@ class Translation(BioInterval):
             self, reference_object=transcript, name=name, start=start, end=end, seq=seq
         )
         self.domains = [d for d in domains]
+        # (cds, amino acid sequence) of the last translation, reused while the cds is unchanged
+        self._aa_seq_cache: Optional[Tuple[str, str]] = None
 
         if start <= 0:
             raise AttributeError('start must be a positive integer', start)
@@ -434,7 +433,9 @@ class Translation(BioInterval):
             AttributeError: if the reference sequence has not been given and is not set
         """
         cds = self.get_cds_seq(reference_genome, ignore_cache)
-        return translate(cds)
+        if self._aa_seq_cache is None or self._aa_seq_cache[0] != cds:
+            self._aa_seq_cache = (cds, translate(cds))
+        return self._aa_seq_cache[1]
 
     def key(self):
         """see :func:`structural_variant.annotate.base.BioInterval.key`"""
@@ -53,7 +53,7 @@ class BamCache:
             read: the read to add to the cache
         """
         if not read.is_unmapped and read.reference_start == read.reference_end:
-            _util.logger.debug(f'ignoring invalid read: {read.query_name}')
+            _util.logger.debug('ignoring invalid read: %s', read.query_name)
             return
         if not isinstance(read, SamRead):
             read = SamRead.copy(read)
@@ -173,7 +173,7 @@ class BamCache:
             if stop_on_cached_read and self.has_read(read):
                 break
             if not read.is_unmapped and read.reference_start == read.reference_end:
-                _util.logger.debug(f'ignoring invalid read {read.query_name}')
+                _util.logger.debug('ignoring invalid read %s', read.query_name)
                 continue
             read = SamRead.copy(read)
             if not filter_if(read):
@@ -238,7 +238,7 @@ class BamCache:
                 if bin_limit is not None and count >= running_surplus:
                     break
                 if not read.is_unmapped and read.reference_start == read.reference_end:
-                    _util.logger.debug(f'ignoring invalid read {read.query_name}')
+                    _util.logger.debug('ignoring invalid read %s', read.query_name)
                     continue
                 read = SamRead.copy(read)
                 if not filter_if(read):
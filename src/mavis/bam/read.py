@@ -216,28 +216,25 @@ def map_ref_range_to_query_range(read: pysam.AlignedSegment, ref_range: Interval
     return Interval(qstart, qend)
 
 
-def breakpoint_pos(read: pysam.AlignedSegment, orient: str = ORIENT.NS) -> int:
+def breakpoint_pos_or_none(read: pysam.AlignedSegment, orient: str = ORIENT.NS) -> Optional[int]:
     """
-    assumes the breakpoint is the position following softclipping on the side with more
-    softclipping (unless and orientation has been specified)
+    same as breakpoint_pos but returns None when the soft-clipping does not support the orientation
+    rather than raising an error. Used in the split read loops where most reads do not support a
+    given breakpoint and building the error (which includes the read tags) is wasted work
 
     Args:
         read: the read object
         orient: the orientation
 
     Returns:
-        the position of the breakpoint in the input read
+        the position of the breakpoint in the input read or None if it cannot be computed
     """
     typ, freq = read.cigar[0]
     end_typ, end_freq = read.cigar[-1]
-    ORIENT.enforce(orient)
-
-    if typ != CIGAR.S and end_typ != CIGAR.S:
-        raise AttributeError(
-            'cannot compute breakpoint for a read without soft-clipping', read.cigar
-        )
 
     if orient == ORIENT.NS:
+        if typ != CIGAR.S and end_typ != CIGAR.S:
+            return None
         if (
             (typ == CIGAR.S and end_typ == CIGAR.S and freq > end_freq)
             or typ == CIGAR.S
@@ -251,22 +248,40 @@ def breakpoint_pos(read: pysam.AlignedSegment, orient: str = ORIENT.NS) -> int:
 
     if orient == ORIENT.RIGHT:
         if typ != CIGAR.S:
-            raise AttributeError(
-                'soft clipping doesn\'t support input orientation for a breakpoint',
-                repr(orient),
-                read.cigar,
-                read.get_tags(),
-            )
+            return None
         return read.reference_start
-    else:
-        if end_typ != CIGAR.S:
-            raise AttributeError(
-                'soft clipping doesn\'t support input orientation for a breakpoint',
-                orient,
-                read.cigar,
-                read.get_tags(),
-            )
-        return read.reference_end - 1
+    if end_typ != CIGAR.S:
+        return None
+    return read.reference_end - 1
+
+
+def breakpoint_pos(read: pysam.AlignedSegment, orient: str = ORIENT.NS) -> int:
+    """
+    assumes the breakpoint is the position following softclipping on the side with more
+    softclipping (unless and orientation has been specified)
+
+    Args:
+        read: the read object
+        orient: the orientation
+
+    Returns:
+        the position of the breakpoint in the input read
+    """
+    ORIENT.enforce(orient)
+    pos = breakpoint_pos_or_none(read, orient)
+    if pos is not None:
+        return pos
+
+    if read.cigar[0][0] != CIGAR.S and read.cigar[-1][0] != CIGAR.S:
+        raise AttributeError(
+            'cannot compute breakpoint for a read without soft-clipping', read.cigar
+        )
+    raise AttributeError(
+        'soft clipping doesn\'t support input orientation for a breakpoint',
+        repr(orient),
+        read.cigar,
+        read.get_tags(),
+    )
 
 
 def calculate_alignment_score(read: pysam.AlignedSegment, consec_bonus=1) -> float:
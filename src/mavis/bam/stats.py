@@ -64,26 +64,29 @@ class Histogram(dict):
 
     def median(self):
         """
-        flattens the histogram to compute the median value
+        walks the cumulative frequencies of the sorted keys to find the median value without
+        flattening the histogram
         """
-        values = []
-        for val, freq in self.items():
-            for i in range(0, freq):
-                values.append(val)
-        values.sort()
-        if len(values) % 2 == 0:
-            low_center = len(values) // 2
-            high_center = len(values) // 2 + 1
-            return (values[low_center - 1] + values[high_center - 1]) / 2
-        else:
-            center = len(values) // 2 + 1
-            return values[center - 1]
+        total = sum(self.values())
+        low_center = (total - 1) // 2
+        high_center = total // 2
+        low_value = None
+        seen = 0
+        for val in sorted(self):
+            seen += self[val]
+            if low_value is None and seen > low_center:
+                low_value = val
+            if seen > high_center:
+                if total % 2 == 0:
+                    return (low_value + val) / 2
+                return val
+        raise IndexError('cannot compute the median of an empty histogram')
 
-    def distribution_stderr(self, median, fraction, error_function=lambda x, y: math.pow(x - y, 2)):
+    def distribution_stderr(self, median, fraction, error_function=lambda x, y: (x - y) * (x - y)):
         values = []
         for val, freq in self.items():
             err = error_function(val, median)
-            values.extend([err for i in range(0, freq)])
+            values.extend([err] * freq)
         values.sort()
 
         end = int(len(values) * fraction)
@@ -13,6 +13,8 @@ class Breakpoint(Interval):
     coordinates are given as 1-indexed
     """
 
+    __slots__ = ('orient', 'chr', 'strand', 'seq')
+
     orient: str
     chr: str
     strand: str
@@ -390,9 +392,10 @@ class BreakpointPair:
                         return {SVTYPE.DEL}
                     elif distance:
                         try:
-                            if pair.net_size(distance).start > 0:
+                            net_size = pair.net_size(distance)
+                            if net_size.start > 0:
                                 return {SVTYPE.INS}
-                            elif pair.net_size(distance).end < 0:
+                            elif net_size.end < 0:
                                 return {SVTYPE.DEL}
                         except ValueError:
                             pass
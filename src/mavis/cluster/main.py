@@ -54,9 +54,10 @@ def split_clusters(
 
     assert sum([len(j) for j in jobs]) == len(clusters)
     output_files = []
+    batch_prefix = os.path.join(outputdir, 'batch-')
     for i, job in enumerate(jobs):
         # generate an output file
-        filename = os.path.join(outputdir, 'batch-{}.tab'.format(i + 1))
+        filename = f'{batch_prefix}{i + 1}.tab'
         output_files.append(filename)
         output_tabbed_file(job, filename)
     return output_files
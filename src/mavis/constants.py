@@ -7,7 +7,8 @@ from typing import List
 
 from Bio.Alphabet import Gapped
 from Bio.Alphabet.IUPAC import ambiguous_dna
-from Bio.Data.IUPACData import ambiguous_dna_values
+from Bio.Data.CodonTable import unambiguous_dna_by_id
+from Bio.Data.IUPACData import ambiguous_dna_complement, ambiguous_dna_values
 from Bio.Seq import Seq
 from mavis_config.constants import MavisNamespace
 
@@ -68,9 +69,16 @@ CODON_SIZE: int = 3
 """the number of bases making up a codon"""
 
 
+_DNA_COMPLEMENT_TABLE = str.maketrans(
+    ''.join(ambiguous_dna_complement) + ''.join(ambiguous_dna_complement).lower(),
+    ''.join(ambiguous_dna_complement.values()) + ''.join(ambiguous_dna_complement.values()).lower(),
+)
+_LETTERS_PATTERN = re.compile('^[A-Za-z]*$')
+
+
 def reverse_complement(s: str) -> str:
     """
-    wrapper for the Bio.Seq reverse_complement method
+    reverse complements a DNA sequence using the Bio.Seq ambiguous DNA complement table
 
     Args:
         s: the input DNA sequence
@@ -86,10 +94,13 @@ def reverse_complement(s: str) -> str:
         'ACCGGAT'
     """
     input_string = str(s)
-    if not re.match('^[A-Za-z]*$', input_string):
+    if not _LETTERS_PATTERN.match(input_string):
         raise ValueError('unexpected sequence format. cannot reverse complement', input_string)
-    seq = Seq(input_string, DNA_ALPHABET)
-    return str(seq.reverse_complement())
+    return input_string.translate(_DNA_COMPLEMENT_TABLE)[::-1]
+
+
+_CODON_TABLE = dict(unambiguous_dna_by_id[1].forward_table)
+_CODON_TABLE.update({codon: '*' for codon in unambiguous_dna_by_id[1].stop_codons})
 
 
 def translate(s: str, reading_frame: int = 0) -> str:
@@ -110,6 +121,12 @@ def translate(s: str, reading_frame: int = 0) -> str:
         temp = temp[:-1]
     elif len(temp) % 3 == 2:
         temp = temp[:-2]
+    try:
+        return ''.join(
+            [_CODON_TABLE[temp[i : i + CODON_SIZE]] for i in range(0, len(temp), CODON_SIZE)]
+        )
+    except KeyError:  # ambiguous or lower case codons are left to Bio.Seq
+        pass
     temp = Seq(temp, DNA_ALPHABET)
     return str(temp.translate())  # type: ignore
 
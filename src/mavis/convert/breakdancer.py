@@ -9,14 +9,15 @@ def convert_file(input_file):
     # read comments
     with open(input_file, 'r') as fh:
         # comments in breakdancer are marked with a single # so they need to be discarded before reading
-        lines = fh.readlines()
-        line_index = 0
-        while line_index < len(lines) and lines[line_index].startswith('#'):
-            metadata_match = re.match(r'^#(\S+)\t.*\tlibrary:(\S+)\t.*', lines[line_index])
+        header_line = ''
+        for line in fh:
+            if not line.startswith('#'):
+                break
+            metadata_match = re.match(r'^#(\S+)\t.*\tlibrary:(\S+)\t.*', line)
             if metadata_match:
                 bam_to_lib[metadata_match.group(1)] = metadata_match.group(2)
-            line_index += 1
-        header = [c.strip() for c in re.sub(r'^#', '', lines[line_index - 1]).split('\t')]
+            header_line = line
+        header = [c.strip() for c in re.sub(r'^#', '', header_line).split('\t')]
     # read the main file
     df = pd.read_csv(
         input_file,
@@ -2,10 +2,12 @@ from typing import List, Optional, Tuple
 
 
 class Interval:
+    __slots__ = ('start', 'end', 'freq', 'number_type', 'forward_to_reverse')
+
     start: int
     end: int
-    freq: int = 1
-    forward_to_reverse: Optional[bool] = None
+    freq: int
+    forward_to_reverse: Optional[bool]
 
     def __init__(self, start: int, end: Optional[int] = None, freq: int = 1, number_type=None):
         """
@@ -36,6 +38,7 @@ class Interval:
         self.freq = int(freq)
         if self.freq <= 0:
             raise AttributeError('Interval frequency must be a natural number')
+        self.forward_to_reverse = None
 
     def __sub__(self, other):  # difference
         """the difference of two intervals
@@ -125,7 +125,7 @@ def log_arguments(args):
             for v in val:
                 logger.info(f'{indent * 2}{repr(v)}')
             logger.info(f'{indent}]')
-        elif any([isinstance(val, typ) for typ in [str, int, float, bool, tuple]]) or val is None:
+        elif isinstance(val, (str, int, float, bool, tuple)) or val is None:
             logger.info(f'{indent}{arg}= {repr(val)}')
         else:
             logger.info(f'{arg} = {object.__repr__(val)}')
@@ -219,8 +219,7 @@ def output_tabbed_file(bpps: List[BreakpointPair], filename: str, header=None):
 def write_bed_file(filename, bed_rows):
     logger.info(f'writing: {filename}')
     with open(filename, 'w') as fh:
-        for bed in bed_rows:
-            fh.write('\t'.join([str(c) for c in bed]) + '\n')
+        fh.writelines('\t'.join(map(str, bed)) + '\n' for bed in bed_rows)
 
 
 def get_connected_components(adj_matrix):
@@ -339,6 +338,7 @@ def read_bpp_from_input_file(
     if summary:
         integer_columns = integer_columns - SUMMARY_LIST_COLUMNS
         float_columns = float_columns - SUMMARY_LIST_COLUMNS
+    numeric_columns = float_columns | integer_columns
 
     try:
         df = pd.read_csv(
@@ -346,11 +346,7 @@ def read_bpp_from_input_file(
             dtype={
                 **{col: pd.Int64Dtype() for col in integer_columns},
                 **{col: float for col in float_columns},
-                **{
-                    col: str
-                    for col in COLUMNS.keys()
-                    if col not in (float_columns | integer_columns)
-                },
+                **{col: str for col in COLUMNS.keys() if col not in numeric_columns},
             },
             sep='\t',
             comment='#',
@@ -382,7 +378,11 @@ def read_bpp_from_input_file(
         df[COLUMNS.untemplated_seq] = None
 
     for col in [COLUMNS.break1_chromosome, COLUMNS.break2_chromosome]:
-        df[col] = df[col].apply(lambda v: re.sub(r'^chr', '', v))
+        missing = df[col].isnull()
+        if missing.any():
+            line_numbers = ', '.join(str(i + 1) for i in df.index[missing])
+            raise TypeError(f'missing chromosome in column ({col}) on line(s): {line_numbers}')
+        df[col] = df[col].str.replace(r'^chr', '', regex=True)
 
     if COLUMNS.tracking_id not in df:
         df[COLUMNS.tracking_id] = ''
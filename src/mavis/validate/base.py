@@ -24,6 +24,8 @@ from ..error import NotSpecifiedError
 from ..interval import Interval
 from ..util import logger
 
+_INS_DUP = frozenset({SVTYPE.INS, SVTYPE.DUP})
+
 
 class Evidence(BreakpointPair):
     assembly_max_kmer_size: int
@@ -319,7 +321,7 @@ class Evidence(BreakpointPair):
                 read = self.standardize_read(read)
             # in the correct position, now determine if it can support the event types
             for event_type in self.putative_event_types():
-                if event_type in [SVTYPE.DUP, SVTYPE.INS]:
+                if event_type in _INS_DUP:
                     if CIGAR.I in [c[0] for c in read.cigar]:
                         self.spanning_reads.add(read)
                         return True
@@ -1110,7 +1112,7 @@ class Evidence(BreakpointPair):
                 mates = self.bam_cache.get_mate(flanking_read, allow_file_access=False)
                 for mate in mates:
                     if mate.is_unmapped:
-                        logger.debug(f'ignoring unmapped mate {mate.query_name}')
+                        logger.debug('ignoring unmapped mate %s', mate.query_name)
                         continue
                     self.collect_flanking_pair(flanking_read, mate)
             except KeyError:
@@ -1156,7 +1158,7 @@ class Evidence(BreakpointPair):
                     mates = self.bam_cache.get_mate(flanking_read, allow_file_access=False)
                     for mate in mates:
                         if mate.is_unmapped:
-                            logger.debug(f'ignoring unmapped mate {mate.query_name}')
+                            logger.debug('ignoring unmapped mate %s', mate.query_name)
                             continue
                         try:
                             self.collect_compatible_flanking_pair(
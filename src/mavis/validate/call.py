@@ -1,8 +1,9 @@
 import itertools
-import math
-import statistics
+from operator import attrgetter
 from typing import List, Optional, Set
 
+import numpy as np
+
 from ..align import SplitAlignment, call_paired_read_event, call_read_events, convert_to_duplication
 from ..assemble import Contig
 from ..bam import read as _read
@@ -17,7 +18,10 @@ from ..constants import (
     reverse_complement,
 )
 from ..interval import Interval
-from ..validate.base import Evidence
+from ..validate.base import _INS_DUP, Evidence
+
+_DEL_DUP = frozenset({SVTYPE.DEL, SVTYPE.DUP})
+_query_name = attrgetter('query_name')
 
 
 class EventCall(BreakpointPair):
@@ -153,9 +157,11 @@ class EventCall(BreakpointPair):
         """return a set of all reads which support the call"""
         support = set()
         support.update(self.spanning_reads)
-        for read, mate in self.flanking_pairs | self.compatible_flanking_pairs:
-            support.add(read)
-            support.add(mate)
+        # iterate both sets of pairs directly rather than building their union
+        for pairs in (self.flanking_pairs, self.compatible_flanking_pairs):
+            for read, mate in pairs:
+                support.add(read)
+                support.add(mate)
         support.update(self.break1_split_reads)
         support.update(self.break2_split_reads)
         if self.contig:
@@ -204,95 +210,95 @@ class EventCall(BreakpointPair):
             ]
         )
         max_frag = len(self.break1 | self.break2) + self.source_evidence.max_expected_fragment_size
+        # these are constant for the current call so look them up once rather than per pair
+        compute_fragment_size = self.source_evidence.compute_fragment_size
+        min_expected_fragment_size = self.source_evidence.min_expected_fragment_size
+        event_type = self.event_type
+        is_del = event_type == SVTYPE.DEL
+        is_ins = event_type == SVTYPE.INS
+        support_type = event_type if not is_compatible else self.compatible_type
+        interchromosomal = self.interchromosomal
+        left = ORIENT.LEFT if not is_compatible else ORIENT.RIGHT
+        break1_left = self.break1.orient == left
+        break2_left = self.break2.orient == left
+        break1_start, break1_end = self.break1.start, self.break1.end
+        break2_start, break2_end = self.break2.start, self.break2.end
+        supporting_pairs = self.compatible_flanking_pairs if is_compatible else self.flanking_pairs
 
         for read, mate in flanking_pairs:
-            # check that the fragment size is reasonable
-            fragment_size = self.source_evidence.compute_fragment_size(read, mate)
-            if self.event_type == SVTYPE.DEL:
+            # check that the fragment size is reasonable (only constrained for deletions/insertions)
+            if is_del:
+                fragment_size = compute_fragment_size(read, mate)
                 if fragment_size.end < min_frag or fragment_size.start > max_frag:
                     continue
-            elif self.event_type == SVTYPE.INS:
-                if fragment_size.start >= self.source_evidence.min_expected_fragment_size:
+            elif is_ins:
+                if compute_fragment_size(read, mate).start >= min_expected_fragment_size:
                     continue
-            if self.interchromosomal != (read.reference_id != mate.reference_id):
+            if interchromosomal != (read.reference_id != mate.reference_id):
                 continue
             # check that the flanking reads work with the current call
-            if not _read.orientation_supports_type(
-                read, self.event_type if not is_compatible else self.compatible_type
-            ):
+            if not _read.orientation_supports_type(read, support_type):
                 continue
             # check that the positions make sense
-            left = ORIENT.LEFT if not is_compatible else ORIENT.RIGHT
-            if self.break1.orient == left:
-                if self.break2.orient == left:  # L L
-                    if not all(
-                        [
-                            read.reference_start + 1 <= self.break1.end,
-                            mate.reference_start + 1 <= self.break2.end,
-                            mate.reference_end > self.break1.start or self.interchromosomal,
-                        ]
+            if break1_left:
+                if break2_left:  # L L
+                    if not (
+                        read.reference_start + 1 <= break1_end
+                        and mate.reference_start + 1 <= break2_end
+                        and (mate.reference_end > break1_start or interchromosomal)
                     ):
                         continue
                 else:  # L R
-                    if not all(
-                        [
-                            read.reference_start + 1 <= self.break1.end,
-                            mate.reference_end >= self.break2.start,
-                        ]
+                    if not (
+                        read.reference_start + 1 <= break1_end
+                        and mate.reference_end >= break2_start
                     ):
                         continue
             else:
-                if self.break2.orient == left:  # R L
-                    if not all(
-                        [
-                            read.reference_end >= self.break1.start,
-                            mate.reference_start + 1 <= self.break2.end,
-                        ]
+                if break2_left:  # R L
+                    if not (
+                        read.reference_end >= break1_start
+                        and mate.reference_start + 1 <= break2_end
                     ):
                         continue
                 else:  # R R
-                    if not all(
-                        [
-                            read.reference_end >= self.break1.start,
-                            mate.reference_end >= self.break2.start,
-                            read.reference_end < self.break2.end or self.interchromosomal,
-                        ]
+                    if not (
+                        read.reference_end >= break1_start
+                        and mate.reference_end >= break2_start
+                        and (read.reference_end < break2_end or interchromosomal)
                     ):
                         continue
-            if is_compatible:
-                self.compatible_flanking_pairs.add((read, mate))
-            else:
-                self.flanking_pairs.add((read, mate))
+            supporting_pairs.add((read, mate))
 
     def add_break1_split_read(self, read):
         """
         Args:
             read (pysam.AlignedSegment): putative split read supporting the first breakpoint
         """
-        try:
-            pos = _read.breakpoint_pos(read, self.break1.orient) + 1
-            if Interval.overlaps(
-                (pos, pos),
-                (self.break1.start - self.utemp_shift[0], self.break1.end + self.utemp_shift[0]),
-            ):
-                self.break1_split_reads.add(read)
-        except AttributeError:
-            pass
+        pos = _read.breakpoint_pos_or_none(read, self.break1.orient)
+        if pos is None:
+            return
+        pos += 1
+        if Interval.overlaps(
+            (pos, pos),
+            (self.break1.start - self.utemp_shift[0], self.break1.end + self.utemp_shift[0]),
+        ):
+            self.break1_split_reads.add(read)
 
     def add_break2_split_read(self, read):
         """
         Args:
             read (pysam.AlignedSegment): putative split read supporting the second breakpoint
         """
-        try:
-            pos = _read.breakpoint_pos(read, self.break2.orient) + 1
-            if Interval.overlaps(
-                (pos, pos),
-                (self.break2.start - self.utemp_shift[1], self.break2.end + self.utemp_shift[1]),
-            ):
-                self.break2_split_reads.add(read)
-        except AttributeError:
-            pass
+        pos = _read.breakpoint_pos_or_none(read, self.break2.orient)
+        if pos is None:
+            return
+        pos += 1
+        if Interval.overlaps(
+            (pos, pos),
+            (self.break2.start - self.utemp_shift[1], self.break2.end + self.utemp_shift[1]),
+        ):
+            self.break2_split_reads.add(read)
 
     def add_spanning_read(self, read):
         """
@@ -328,12 +334,9 @@ class EventCall(BreakpointPair):
         median = 0
         stdev = 0
         if fragment_sizes:
-            median = statistics.median(fragment_sizes)
-            err = 0
-            for insert in fragment_sizes:
-                err += math.pow(insert - median, 2)
-            err /= len(fragment_sizes)
-            stdev = math.sqrt(err)
+            sizes = np.array(fragment_sizes)
+            median = float(np.median(sizes))
+            stdev = float(np.sqrt(np.mean(np.square(sizes - median))))
         return median, stdev
 
     def break1_split_read_names(self, tgt=False, both=False):
@@ -342,18 +345,16 @@ class EventCall(BreakpointPair):
             tgt (bool): return only target re-aligned read names
             both (bool): return both original alignments and target-realigned
         """
+        if both:
+            return set(map(_query_name, self.break1_split_reads))
+        tag = PYSAM_READ_FLAGS.TARGETED_ALIGNMENT
         reads = set()
         for read in self.break1_split_reads:
-            if read.has_tag(PYSAM_READ_FLAGS.TARGETED_ALIGNMENT) and read.get_tag(
-                PYSAM_READ_FLAGS.TARGETED_ALIGNMENT
-            ):
+            if read.has_tag(tag) and read.get_tag(tag):
                 if tgt:
                     reads.add(read.query_name)
             elif not tgt:
                 reads.add(read.query_name)
-
-            if both:
-                reads.add(read.query_name)
         return reads
 
     def break2_split_read_names(self, tgt=False, both=False):
@@ -362,18 +363,16 @@ class EventCall(BreakpointPair):
             tgt (bool): return only target re-aligned read names
             both (bool): return both original alignments and target-realigned
         """
+        if both:
+            return set(map(_query_name, self.break2_split_reads))
+        tag = PYSAM_READ_FLAGS.TARGETED_ALIGNMENT
         reads = set()
         for read in self.break2_split_reads:
-            if read.has_tag(PYSAM_READ_FLAGS.TARGETED_ALIGNMENT) and read.get_tag(
-                PYSAM_READ_FLAGS.TARGETED_ALIGNMENT
-            ):
+            if read.has_tag(tag) and read.get_tag(tag):
                 if tgt:
                     reads.add(read.query_name)
             elif not tgt:
                 reads.add(read.query_name)
-
-            if both:
-                reads.add(read.query_name)
         return reads
 
     def linking_split_read_names(self):
@@ -394,7 +393,7 @@ class EventCall(BreakpointPair):
         elif not any(
             [
                 event.event_type == SVTYPE.INS and event.untemplated_seq,
-                event.event_type in {SVTYPE.DEL, SVTYPE.DUP} and not event.untemplated_seq,
+                event.event_type in _DEL_DUP and not event.untemplated_seq,
             ]
         ):
             raise ValueError(
@@ -538,7 +537,7 @@ class EventCall(BreakpointPair):
                     COLUMNS.contig_alignment_rank: self.contig_alignment.alignment_rank().center,
                     COLUMNS.contig_remapped_reads: len(self.contig.input_reads),
                     COLUMNS.contig_remapped_read_names: ';'.join(
-                        sorted(set([r.query_name for r in self.contig.input_reads]))
+                        sorted(set(map(_query_name, self.contig.input_reads)))
                     ),
                     COLUMNS.contig_strand_specific: self.contig.strand_specific,
                     COLUMNS.contig_alignment_query_consumption: self.contig_alignment.query_consumption(),
@@ -723,8 +722,8 @@ def call_events(source_evidence) -> List[EventCall]:
 
     # for ins/dup check for compatible call as well
     putative_types = source_evidence.putative_event_types()
-    if putative_types & {SVTYPE.INS, SVTYPE.DUP}:
-        putative_types.update({SVTYPE.INS, SVTYPE.DUP})
+    if putative_types & _INS_DUP:
+        putative_types.update(_INS_DUP)
 
     for event_type in sorted(putative_types):
         # try calling by split/flanking reads
@@ -812,39 +811,46 @@ def _call_by_flanking_pairs(evidence, event_type, consumed_evidence=None):
     selected_flanking_pairs = []
     fragments = []
     available_flanking_pairs = filter_consumed_pairs(evidence.flanking_pairs, consumed_evidence)
+    # evidence attributes used in the per-pair loops
+    compute_fragment_size = evidence.compute_fragment_size
+    min_expected_fragment_size = evidence.min_expected_fragment_size
+    max_expected_fragment_size = evidence.max_expected_fragment_size
+    break1_left = evidence.break1.orient == ORIENT.LEFT
+    break2_left = evidence.break2.orient == ORIENT.LEFT
 
     def _compute_coverage_intervals(pairs):
-        first_positions = []
-        second_positions = []
+        # track the extremes directly rather than collecting every position
+        first_min = second_min = float('inf')
+        first_max = second_max = float('-inf')
         for read, mate in pairs:
-            if evidence.break1.orient == ORIENT.LEFT:
-                first_positions.extend(
-                    [read.reference_end, read.reference_end - read.query_alignment_length + 1]
-                )
+            if break1_left:
+                pos_a = read.reference_end
+                pos_b = read.reference_end - read.query_alignment_length + 1
             else:
-                first_positions.extend(
-                    [read.reference_start + 1, read.reference_start + read.query_alignment_length]
-                )
-            if evidence.break2.orient == ORIENT.LEFT:
-                second_positions.extend(
-                    [mate.reference_end, mate.reference_end - mate.query_alignment_length + 1]
-                )
+                pos_a = read.reference_start + 1
+                pos_b = read.reference_start + read.query_alignment_length
+            first_min = min(first_min, pos_a, pos_b)
+            first_max = max(first_max, pos_a, pos_b)
+            if break2_left:
+                pos_a = mate.reference_end
+                pos_b = mate.reference_end - mate.query_alignment_length + 1
             else:
-                second_positions.extend(
-                    [mate.reference_start + 1, mate.reference_start + mate.query_alignment_length]
-                )
-        cover1 = Interval(min(first_positions), max(first_positions))
-        cover2 = Interval(min(second_positions), max(second_positions))
+                pos_a = mate.reference_start + 1
+                pos_b = mate.reference_start + mate.query_alignment_length
+            second_min = min(second_min, pos_a, pos_b)
+            second_max = max(second_max, pos_a, pos_b)
+        cover1 = Interval(first_min, first_max)
+        cover2 = Interval(second_min, second_max)
         return cover1, cover2
 
     for read, mate in sorted(available_flanking_pairs, key=lambda r: (r[0].key(), r[1].key())):
         # check that the fragment size is reasonable
-        fragment_size = evidence.compute_fragment_size(read, mate)
+        fragment_size = compute_fragment_size(read, mate)
         if event_type == SVTYPE.DEL:
-            if fragment_size.end <= evidence.max_expected_fragment_size:
+            if fragment_size.end <= max_expected_fragment_size:
                 continue
         elif event_type == SVTYPE.INS:
-            if fragment_size.start >= evidence.min_expected_fragment_size:
+            if fragment_size.start >= min_expected_fragment_size:
                 continue
         fragments.append(fragment_size)
         selected_flanking_pairs.append((read, mate))
@@ -860,7 +866,7 @@ def _call_by_flanking_pairs(evidence, event_type, consumed_evidence=None):
             window1 = _call_interval_by_flanking_coverage(
                 cover1,
                 evidence.break1.orient,
-                evidence.max_expected_fragment_size,
+                max_expected_fragment_size,
                 evidence.read_length,
                 distance=evidence.distance,
                 traverse=evidence.traverse,
@@ -868,7 +874,7 @@ def _call_by_flanking_pairs(evidence, event_type, consumed_evidence=None):
             window2 = _call_interval_by_flanking_coverage(
                 cover2,
                 evidence.break2.orient,
-                evidence.max_expected_fragment_size,
+                max_expected_fragment_size,
                 evidence.read_length,
                 distance=evidence.distance,
                 traverse=evidence.traverse,
@@ -877,16 +883,14 @@ def _call_by_flanking_pairs(evidence, event_type, consumed_evidence=None):
             # length of coverage is greater than expected
             # remove the farthest outlier from the pairs wrt fragment size (most likely to belong to a different event)
             average = Interval(
-                sum([f.start for f in fragments]) / len(fragments),
-                sum([f.end for f in fragments]) / len(fragments),
+                sum(f.start for f in fragments) / len(fragments),
+                sum(f.end for f in fragments) / len(fragments),
             )
             farthest = max(fragments, key=lambda f: abs(Interval.dist(f, average)))
-            fragments = [f for f in fragments if f != farthest]
-            selected_flanking_pairs = [
-                (r, m)
-                for r, m in selected_flanking_pairs
-                if evidence.compute_fragment_size(r, m) != farthest
-            ]
+            # fragments and selected_flanking_pairs are parallel so the sizes do not need to be recomputed
+            keep = [i for i, f in enumerate(fragments) if f != farthest]
+            fragments = [fragments[i] for i in keep]
+            selected_flanking_pairs = [selected_flanking_pairs[i] for i in keep]
         else:
             break
     if len(selected_flanking_pairs) < evidence.config['validate.min_flanking_pairs_resolution']:
@@ -967,152 +971,169 @@ def _call_by_split_reads(evidence, event_type, consumed_evidence=None):
     pos2 = {}
 
     available_flanking_pairs = filter_consumed_pairs(evidence.flanking_pairs, consumed_evidence)
+    breakpoint_pos = _read.breakpoint_pos_or_none
+    tag = PYSAM_READ_FLAGS.TARGETED_ALIGNMENT
+
+    min_splits_reads = evidence.config['validate.min_splits_reads_resolution']
+    min_non_target_reads = evidence.config['validate.min_non_target_aligned_split_reads']
 
     for i, breakpoint, pos_dict in [(0, evidence.break1, pos1), (1, evidence.break2, pos2)]:
+        orient = breakpoint.orient
+        non_target_counts = {}
         for read in evidence.split_reads[i] - consumed_evidence:
-            try:
-                pos = _read.breakpoint_pos(read, breakpoint.orient) + 1
-                if pos not in pos_dict:
-                    pos_dict[pos] = set()
-                pos_dict[pos].add(read)
-            except AttributeError:
-                pass
-        putative_positions = list(pos_dict.keys())
-        for pos in putative_positions:
-            if len(pos_dict[pos]) < evidence.config['validate.min_splits_reads_resolution']:
+            pos = breakpoint_pos(read, orient)
+            if pos is None:
+                continue
+            pos += 1
+            if pos not in pos_dict:
+                pos_dict[pos] = set()
+            pos_dict[pos].add(read)
+            if not read.has_tag(tag) or not read.get_tag(tag):
+                non_target_counts[pos] = non_target_counts.get(pos, 0) + 1
+        for pos in list(pos_dict.keys()):
+            if (
+                len(pos_dict[pos]) < min_splits_reads
+                or non_target_counts.get(pos, 0) < min_non_target_reads
+            ):
                 del pos_dict[pos]
-            else:
-                count = 0
-                for read in pos_dict[pos]:
-                    if not read.has_tag(PYSAM_READ_FLAGS.TARGETED_ALIGNMENT) or not read.get_tag(
-                        PYSAM_READ_FLAGS.TARGETED_ALIGNMENT
-                    ):
-                        count += 1
-                if count < evidence.config['validate.min_non_target_aligned_split_reads']:
-                    del pos_dict[pos]
 
     linked_pairings = []
+    same_chr = evidence.break1.chr == evidence.break2.chr
+    second_positions = sorted(pos2.items())
     # now pair up the breakpoints with their putative partners
-    for first, second in itertools.product(sorted(pos1.keys()), sorted(pos2.keys())):
-        if evidence.break1.chr == evidence.break2.chr:
-            if first >= second:
+    for first, first_reads in sorted(pos1.items()):
+        # the read names for the first breakpoint position are re-used for every second position
+        read_names = set(map(_query_name, first_reads))
+        first_read_seqs = {(r.query_name, r.query_sequence) for r in first_reads}
+        for second, second_reads in second_positions:
+            if same_chr and first >= second:
                 continue
-        links = 0
-        read_names = set([r.query_name for r in pos1[first]])
-        reads = set([(r.query_name, r.query_sequence) for r in pos1[first]])
-        tgt_align = 0
-        for read in pos2[second]:
-            if read.query_name in read_names:
-                links += 1
-            if (read.query_name, read.query_sequence) in reads:
-                tgt_align += 1
-        if links < evidence.config['validate.min_linking_split_reads']:
-            continue
-        deletion_size = second - first - 1
-        if tgt_align >= evidence.config['validate.min_double_aligned_to_estimate_insertion_size']:
-            # we can estimate the fragment size
-            max_insert = evidence.read_length - 2 * evidence.config['validate.min_softclipping']
-            if event_type == SVTYPE.INS and max_insert < deletion_size:
-                continue
-        elif links >= evidence.config['validate.min_double_aligned_to_estimate_insertion_size']:
-            if deletion_size > evidence.max_expected_fragment_size and event_type == SVTYPE.INS:
+            links = 0
+            tgt_align = 0
+            for read in second_reads:
+                if read.query_name in read_names:
+                    links += 1
+                if (read.query_name, read.query_sequence) in first_read_seqs:
+                    tgt_align += 1
+            if links < evidence.config['validate.min_linking_split_reads']:
                 continue
+            deletion_size = second - first - 1
+            if (
+                tgt_align
+                >= evidence.config['validate.min_double_aligned_to_estimate_insertion_size']
+            ):
+                # we can estimate the fragment size
+                max_insert = evidence.read_length - 2 * evidence.config['validate.min_softclipping']
+                if event_type == SVTYPE.INS and max_insert < deletion_size:
+                    continue
+            elif links >= evidence.config['validate.min_double_aligned_to_estimate_insertion_size']:
+                if deletion_size > evidence.max_expected_fragment_size and event_type == SVTYPE.INS:
+                    continue
 
-        # check if any of the aligned reads are 'double' aligned
-        double_aligned = dict()
-        for read in pos1[first] | pos2[second]:
-            seq_key = tuple(
-                sorted(
-                    [read.query_name, read.query_sequence, reverse_complement(read.query_sequence)]
-                )
-            )  # seq and revseq are equal
-            double_aligned.setdefault(seq_key, []).append(read)
-
-        # now create calls using the double aligned split read pairs if possible (to resolve untemplated sequence)
-        resolved_calls = dict()
-        for reads in [d for d in double_aligned.values() if len(d) > 1]:
-            for read1, read2 in itertools.combinations(
-                sorted(list(reads), key=lambda x: x.key()), 2
+            # check if any of the aligned reads are 'double' aligned
+            double_aligned = dict()
+            for read in first_reads | second_reads:
+                seq_key = tuple(
+                    sorted(
+                        [
+                            read.query_name,
+                            read.query_sequence,
+                            reverse_complement(read.query_sequence),
+                        ]
+                    )
+                )  # seq and revseq are equal
+                double_aligned.setdefault(seq_key, []).append(read)
+
+            # now create calls using the double aligned split read pairs if possible (to resolve untemplated sequence)
+            resolved_calls = dict()
+            for reads in [d for d in double_aligned.values() if len(d) > 1]:
+                for read1, read2 in itertools.combinations(
+                    sorted(list(reads), key=lambda x: x.key()), 2
+                ):
+                    try:
+                        call = call_paired_read_event(
+                            read1, read2, is_stranded=evidence.bam_cache.stranded
+                        )
+                        # check the type later, we want this to fail if wrong type
+                        resolved_calls.setdefault(call, (set(), set()))
+                        resolved_calls[call][0].add(call.read1)
+                        resolved_calls[call][1].add(call.read2)
+                    except AssertionError:
+                        pass  # will be thrown if the reads do not actually belong together
+
+            # if no calls were resolved set the untemplated seq to None
+            first_breakpoint = Breakpoint(
+                evidence.break1.chr,
+                first,
+                strand=evidence.break1.strand,
+                orient=evidence.break1.orient,
+            )
+            second_breakpoint = Breakpoint(
+                evidence.break2.chr,
+                second,
+                strand=evidence.break2.strand,
+                orient=evidence.break2.orient,
+            )
+            bpp = BreakpointPair(first_breakpoint, second_breakpoint, event_type=event_type)
+
+            # ignore untemplated sequence since was not known previously
+            if not any(
+                call.break1 == bpp.break1 and call.break2 == bpp.break2 for call in resolved_calls
+            ):
+                resolved_calls.setdefault(bpp, (set(), set()))
+
+            uncons_break1_reads = evidence.split_reads[0] - consumed_evidence
+            uncons_break2_reads = evidence.split_reads[1] - consumed_evidence
+            for call, (reads1, reads2) in sorted(
+                resolved_calls.items(),
+                key=lambda x: (len(x[1][0]) + len(x[1][1]), x[0]),
+                reverse=True,
             ):
                 try:
-                    call = call_paired_read_event(
-                        read1, read2, is_stranded=evidence.bam_cache.stranded
+                    call = EventCall(
+                        call.break1,
+                        call.break2,
+                        evidence,
+                        event_type,
+                        call_method=CALL_METHOD.SPLIT,
+                        untemplated_seq=call.untemplated_seq,
+                        contig_alignment=None if not isinstance(call, SplitAlignment) else call,
                     )
-                    # check the type later, we want this to fail if wrong type
-                    resolved_calls.setdefault(call, (set(), set()))
-                    resolved_calls[call][0].add(call.read1)
-                    resolved_calls[call][1].add(call.read2)
-                except AssertionError:
-                    pass  # will be thrown if the reads do not actually belong together
-
-        # if no calls were resolved set the untemplated seq to None
-        first_breakpoint = Breakpoint(
-            evidence.break1.chr, first, strand=evidence.break1.strand, orient=evidence.break1.orient
-        )
-        second_breakpoint = Breakpoint(
-            evidence.break2.chr,
-            second,
-            strand=evidence.break2.strand,
-            orient=evidence.break2.orient,
-        )
-        bpp = BreakpointPair(first_breakpoint, second_breakpoint, event_type=event_type)
-
-        # ignore untemplated sequence since was not known previously
-        if not any(
-            [call.break1 == bpp.break1 and call.break2 == bpp.break2 for call in resolved_calls]
-        ):
-            resolved_calls.setdefault(bpp, (set(), set()))
-
-        uncons_break1_reads = evidence.split_reads[0] - consumed_evidence
-        uncons_break2_reads = evidence.split_reads[1] - consumed_evidence
-        for call, (reads1, reads2) in sorted(
-            resolved_calls.items(), key=lambda x: (len(x[1][0]) + len(x[1][1]), x[0]), reverse=True
-        ):
-            try:
-                call = EventCall(
-                    call.break1,
-                    call.break2,
-                    evidence,
-                    event_type,
-                    call_method=CALL_METHOD.SPLIT,
-                    untemplated_seq=call.untemplated_seq,
-                    contig_alignment=None if not isinstance(call, SplitAlignment) else call,
-                )
-            except ValueError:  # incompatible types
-                continue
-            else:
-                call.break1_split_reads.update(reads1 - consumed_evidence)
-                call.break2_split_reads.update(reads2 - consumed_evidence)
-
-                call.add_flanking_support(available_flanking_pairs)
-                if call.has_compatible:
-                    call.add_flanking_support(available_flanking_pairs, is_compatible=True)
-                # add the initial reads
-                for read in uncons_break1_reads - consumed_evidence:
-                    call.add_break1_split_read(read)
-                for read in uncons_break2_reads - consumed_evidence:
-                    call.add_break2_split_read(read)
-                linking_reads = len(call.linking_split_read_names())
-                if (
-                    call.event_type == SVTYPE.INS
-                ):  # may not expect linking split reads for insertions
-                    linking_reads += len(call.flanking_pairs)
-                # does it pass the requirements?
-                if not any(
-                    [
-                        len(call.break1_split_read_names(both=True))
-                        < evidence.config['validate.min_splits_reads_resolution'],
-                        len(call.break2_split_read_names(both=True))
-                        < evidence.config['validate.min_splits_reads_resolution'],
-                        len(call.break1_split_read_names()) < 1,
-                        len(call.break2_split_read_names()) < 1,
-                        linking_reads < evidence.config['validate.min_linking_split_reads'],
-                        call.event_type != event_type,
-                    ]
-                ):
-                    linked_pairings.append(call)
-                    # consume the evidence
-                    consumed_evidence.update(call.break1_split_reads)
-                    consumed_evidence.update(call.break2_split_reads)
+                except ValueError:  # incompatible types
+                    continue
+                else:
+                    call.break1_split_reads.update(reads1 - consumed_evidence)
+                    call.break2_split_reads.update(reads2 - consumed_evidence)
+
+                    call.add_flanking_support(available_flanking_pairs)
+                    if call.has_compatible:
+                        call.add_flanking_support(available_flanking_pairs, is_compatible=True)
+                    # add the initial reads
+                    for read in uncons_break1_reads - consumed_evidence:
+                        call.add_break1_split_read(read)
+                    for read in uncons_break2_reads - consumed_evidence:
+                        call.add_break2_split_read(read)
+                    linking_reads = len(call.linking_split_read_names())
+                    if (
+                        call.event_type == SVTYPE.INS
+                    ):  # may not expect linking split reads for insertions
+                        linking_reads += len(call.flanking_pairs)
+                    # does it pass the requirements?
+                    if not any(
+                        [
+                            len(call.break1_split_read_names(both=True))
+                            < evidence.config['validate.min_splits_reads_resolution'],
+                            len(call.break2_split_read_names(both=True))
+                            < evidence.config['validate.min_splits_reads_resolution'],
+                            len(call.break1_split_read_names()) < 1,
+                            len(call.break2_split_read_names()) < 1,
+                            linking_reads < evidence.config['validate.min_linking_split_reads'],
+                            call.event_type != event_type,
+                        ]
+                    ):
+                        linked_pairings.append(call)
+                        # consume the evidence
+                        consumed_evidence.update(call.break1_split_reads)
+                        consumed_evidence.update(call.break2_split_reads)
 
     return linked_pairings
@@ -2,11 +2,13 @@
 Script used in finding potential masking regions within a genome
 """
 import argparse
+import csv
+import logging
 import os
 
 from mavis.annotate.base import BioInterval
 from mavis.annotate.file_io import load_reference_genome
-from mavis.util import log
+from mavis.util import logger
 
 
 def parse_arguments():
@@ -47,9 +49,10 @@ def parse_arguments():
 
 
 def main():
+    logging.basicConfig(format='{message}', style='{', level=logging.INFO)
     args = parse_arguments()
     repeat_sequences = sorted(list(set([s.lower() for s in args.repeat_seq])))
-    log('loading:', args.input)
+    logger.info(f'loading: {args.input}')
     reference_genome = load_reference_genome(args.input)
     comments = [
         os.path.basename(__file__),
@@ -57,11 +60,12 @@ def main():
         'min_length: {}'.format(args.min_length),
         'repeat_seq: {}'.format(', '.join(args.repeat_seq)),
     ]
-    log('writing:', args.output)
+    logger.info(f'writing: {args.output}')
     with open(args.output, 'w') as fh:
         for comment in comments:
             fh.write('## {}\n'.format(comment))
-        fh.write('chr\tstart\tend\tname\n')
+        writer = csv.writer(fh, delimiter='\t', lineterminator='\n')
+        writer.writerow(['chr', 'start', 'end', 'name'])
         visited = set()
         for chrom, seq in sorted(reference_genome.items()):
             if chrom.startswith('chr'):
@@ -73,7 +77,7 @@ def main():
                 visited.add(seq)
             spans = []
             for repseq in repeat_sequences:
-                log(
+                logger.info(
                     'finding {}_repeat (min_length: {}), for chr{} (length: {})'.format(
                         repseq, args.min_length, chrom, len(seq)
                     )
@@ -92,13 +96,10 @@ def main():
                     span = BioInterval(chrom, next_n + 1, index, name='repeat_{}'.format(repseq))
                     if len(span) >= args.min_length and len(span) >= 2 * len(repseq):
                         spans.append(span)
-            log('found', len(spans), 'spans', time_stamp=False)
-            for span in spans:
-                fh.write(
-                    '{}\t{}\t{}\t{}\n'.format(
-                        span.reference_object, span.start, span.end, span.name
-                    )
-                )
+            logger.info(f'found {len(spans)} spans')
+            writer.writerows(
+                (span.reference_object, span.start, span.end, span.name) for span in spans
+            )
 
 
 if __name__ == '__main__':
@@ -1,9 +1,8 @@
 import argparse
-import unittest
 
 import pytest
 from mavis.annotate.base import BioInterval, ReferenceName
-from mavis.annotate.file_io import load_annotations, load_reference_genome
+from mavis.annotate.file_io import load_annotations
 from mavis.annotate.fusion import FusionTranscript, determine_prime
 from mavis.annotate.genomic import Exon, Gene, PreTranscript, Template, Transcript
 from mavis.annotate.protein import Domain, DomainRegion, Translation, calculate_orf, translate
@@ -19,7 +18,7 @@ from mavis.constants import ORIENT, PRIME, PROTOCOL, STRAND, SVTYPE, reverse_com
 from mavis.error import NotSpecifiedError
 from mavis.interval import Interval
 
-from ...util import get_data
+from ...util import get_data, get_mock_reference_genome, todo
 from ..mock import MockObject, get_example_genes
 
 REFERENCE_ANNOTATIONS = None
@@ -35,7 +34,7 @@ def setUpModule():
     count = sum([len(genes) for genes in REFERENCE_ANNOTATIONS.values()])
     print('loaded annotations', count)
     assert count >= 6  # make sure this is the file we expect
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     assert REF_CHR in REFERENCE_GENOME
     print('loaded the reference genome', get_data('mock_reference_genome.fa'))
 
@@ -49,7 +48,17 @@ class TestTemplate:
         assert d[t] == 1
 
 
-@pytest.fixture
+def _fill_sequence(length, background, runs):
+    """
+    build a sequence of a single background base with the given (interval, base) runs painted over it
+    """
+    seq = bytearray(background.encode('ascii') * length)
+    for interval, base in runs:
+        seq[interval.start - 1 : interval.end] = base.encode('ascii') * len(interval)
+    return seq.decode('ascii')
+
+
+@pytest.fixture(scope='module')
 def intervals():
     n = argparse.Namespace()
     n.x = Interval(100, 199)  # C
@@ -58,17 +67,25 @@ def intervals():
     n.w = Interval(1500, 1599)  # C
     n.s = Interval(1700, 1799)  # G
     # introns: 99, 300, 600, 200, 100, ...
-    reference_sequence = 'A' * 99 + 'C' * 100 + 'A' * 300 + 'G' * 100
-    reference_sequence += 'A' * 600 + 'T' * 100 + 'A' * 200 + 'C' * 100
-    reference_sequence += 'A' * 100 + 'G' * 100 + 'A' * 200 + 'T' * 100
-
     n.a = Interval(2000, 2099)  # T
     n.b = Interval(2600, 2699)  # C
     n.c = Interval(3000, 3099)  # G
     n.d = Interval(3300, 3399)  # T
-    reference_sequence += 'A' * 500 + 'C' * 100 + 'A' * 300 + 'G' * 100
-    reference_sequence += 'A' * 200 + 'T' * 100 + 'A' * 200
-    n.reference_sequence = reference_sequence
+    n.reference_sequence = _fill_sequence(
+        3599,
+        'A',
+        [
+            (n.x, 'C'),
+            (n.y, 'G'),
+            (n.z, 'T'),
+            (n.w, 'C'),
+            (n.s, 'G'),
+            (n.a, 'T'),
+            (n.b, 'C'),
+            (n.c, 'G'),
+            (n.d, 'T'),
+        ],
+    )
 
     n.b1 = Interval(600, 699)  # A
     n.b2 = Interval(800, 899)  # G
@@ -76,11 +93,11 @@ def intervals():
     n.b4 = Interval(1400, 1499)  # A
     n.b5 = Interval(1700, 1799)  # G
     n.b6 = Interval(2100, 2199)  # A
-    alternate_sequence = 'C' * 599 + 'A' * 100 + 'C' * 100 + 'G' * 100
-    alternate_sequence += 'C' * 200 + 'T' * 100 + 'C' * 200 + 'A' * 100
-    alternate_sequence += 'C' * 200 + 'G' * 100 + 'C' * 300 + 'A' * 100
-    alternate_sequence += 'C' * 200
-    n.alternate_sequence = alternate_sequence
+    n.alternate_sequence = _fill_sequence(
+        2399,
+        'C',
+        [(n.b1, 'A'), (n.b2, 'G'), (n.b3, 'T'), (n.b4, 'A'), (n.b5, 'G'), (n.b6, 'A')],
+    )
     return n
 
 
@@ -128,7 +145,6 @@ class TestFusionTranscript:
             exons=[intervals.x, intervals.y, intervals.z, intervals.w, intervals.s],
             strand=STRAND.POS,
         )
-        print('transcriptt exons:', t.exons)
         b = Breakpoint(REF_CHR, 199, orient=ORIENT.LEFT)
         seq, new_exons = FusionTranscript._pull_exons(t, b, intervals.reference_sequence)
         expt = 'C' * 100
@@ -314,18 +330,18 @@ class TestFusionTranscript:
         )
         ft = FusionTranscript.build(ann, ref)
 
-        expt = (
-            'C' * len(intervals.x)
-            + 'A' * (499 - 200 + 1)
-            + 'G' * len(intervals.y)
-            + 'ATCGATCG'
-            + 'T' * len(intervals.z)
-        )
-        expt += (
-            'A' * (1499 - 1300 + 1)
-            + 'C' * len(intervals.w)
-            + 'A' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.s)
+        expt = ''.join(
+            [
+                'C' * len(intervals.x),
+                'A' * (499 - 200 + 1),
+                'G' * len(intervals.y),
+                'ATCGATCG',
+                'T' * len(intervals.z),
+                'A' * (1499 - 1300 + 1),
+                'C' * len(intervals.w),
+                'A' * (1699 - 1600 + 1),
+                'G' * len(intervals.s),
+            ]
         )
 
         assert ft.seq == expt
@@ -363,18 +379,19 @@ class TestFusionTranscript:
             bpp, transcript1=t, transcript2=t, event_type=SVTYPE.INV, protocol=PROTOCOL.GENOME
         )
         ft = FusionTranscript.build(ann, ref)
-        expt = (
-            'C' * len(intervals.x)
-            + 'A' * (499 - 200 + 1)
-            + 'G' * len(intervals.y)
-            + 'A' * (1199 - 600 + 1)
-        )
-        expt += 'ATCGTC' + 'A' * len(intervals.z)
-        expt += (
-            'A' * (1499 - 1300 + 1)
-            + 'C' * len(intervals.w)
-            + 'A' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.s)
+        expt = ''.join(
+            [
+                'C' * len(intervals.x),
+                'A' * (499 - 200 + 1),
+                'G' * len(intervals.y),
+                'A' * (1199 - 600 + 1),
+                'ATCGTC',
+                'A' * len(intervals.z),
+                'A' * (1499 - 1300 + 1),
+                'C' * len(intervals.w),
+                'A' * (1699 - 1600 + 1),
+                'G' * len(intervals.s),
+            ]
         )
         exons = [(1, 100), (401, 500), (1407, 1506), (1607, 1706)]
         for i in range(len(exons)):
@@ -398,18 +415,19 @@ class TestFusionTranscript:
             bpp, transcript1=t, transcript2=t, event_type=SVTYPE.INV, protocol=PROTOCOL.TRANS
         )
         ft = FusionTranscript.build(ann, ref)
-        expt = (
-            'C' * len(intervals.x)
-            + 'A' * (499 - 200 + 1)
-            + 'G' * len(intervals.y)
-            + 'A' * (1199 - 600 + 1)
-        )
-        expt += 'ATCGTC' + 'A' * len(intervals.z)
-        expt += (
-            'A' * (1499 - 1300 + 1)
-            + 'C' * len(intervals.w)
-            + 'A' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.s)
+        expt = ''.join(
+            [
+                'C' * len(intervals.x),
+                'A' * (499 - 200 + 1),
+                'G' * len(intervals.y),
+                'A' * (1199 - 600 + 1),
+                'ATCGTC',
+                'A' * len(intervals.z),
+                'A' * (1499 - 1300 + 1),
+                'C' * len(intervals.w),
+                'A' * (1699 - 1600 + 1),
+                'G' * len(intervals.s),
+            ]
         )
         exons = [
             Exon(1, 100, strand=STRAND.POS),
@@ -418,7 +436,6 @@ class TestFusionTranscript:
             Exon(1407, 1506, intact_start_splice=False, strand=STRAND.POS),
             Exon(1607, 1706, strand=STRAND.POS),
         ]
-        print(ft.exons)
         for i in range(len(exons)):
             assert ft.exons[i].start == exons[i].start
             assert ft.exons[i].end == exons[i].end
@@ -443,14 +460,20 @@ class TestFusionTranscript:
         )
         ft = FusionTranscript.build(ann, ref)
 
-        expt = (
-            'C' * len(intervals.s)
-            + 'T' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.w)
-            + 'T' * (1499 - 1300 + 1)
+        expt = ''.join(
+            [
+                'C' * len(intervals.s),
+                'T' * (1699 - 1600 + 1),
+                'G' * len(intervals.w),
+                'T' * (1499 - 1300 + 1),
+                'T' * len(intervals.z),
+                'GACGAT',
+                'T' * (1199 - 600 + 1),
+                'C' * len(intervals.y),
+                'T' * (499 - 200 + 1),
+                'G' * len(intervals.x),
+            ]
         )
-        expt += 'T' * len(intervals.z) + 'GACGAT' + 'T' * (1199 - 600 + 1) + 'C' * len(intervals.y)
-        expt += 'T' * (499 - 200 + 1) + 'G' * len(intervals.x)
 
         exons = [(1, 100), (201, 300), (1207, 1306), (1607, 1706)]
 
@@ -477,18 +500,20 @@ class TestFusionTranscript:
         ft = FusionTranscript.build(ann, ref)
         assert ft.get_strand() == STRAND.POS
 
-        expt = (
-            'C' * len(intervals.x)
-            + 'A' * (499 - 200 + 1)
-            + 'G' * len(intervals.y)
-            + 'A' * (1199 - 600 + 1)
-        )
-        expt += 'T' * len(intervals.z) + 'ATCGATCG' + 'T' * len(intervals.z)
-        expt += (
-            'A' * (1499 - 1300 + 1)
-            + 'C' * len(intervals.w)
-            + 'A' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.s)
+        expt = ''.join(
+            [
+                'C' * len(intervals.x),
+                'A' * (499 - 200 + 1),
+                'G' * len(intervals.y),
+                'A' * (1199 - 600 + 1),
+                'T' * len(intervals.z),
+                'ATCGATCG',
+                'T' * len(intervals.z),
+                'A' * (1499 - 1300 + 1),
+                'C' * len(intervals.w),
+                'A' * (1699 - 1600 + 1),
+                'G' * len(intervals.s),
+            ]
         )
         assert ft.seq == expt
         exons = [(1, 100), (401, 500), (1101, 1200), (1209, 1308), (1509, 1608), (1709, 1808)]
@@ -519,18 +544,20 @@ class TestFusionTranscript:
         ft = FusionTranscript.build(ann, ref)
         assert ft.get_strand() == STRAND.POS
 
-        expt = (
-            'C' * len(intervals.x)
-            + 'A' * (499 - 200 + 1)
-            + 'G' * len(intervals.y)
-            + 'A' * (1199 - 600 + 1)
-        )
-        expt += 'T' * len(intervals.z) + 'ATCGATCG' + 'T' * len(intervals.z)
-        expt += (
-            'A' * (1499 - 1300 + 1)
-            + 'C' * len(intervals.w)
-            + 'A' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.s)
+        expt = ''.join(
+            [
+                'C' * len(intervals.x),
+                'A' * (499 - 200 + 1),
+                'G' * len(intervals.y),
+                'A' * (1199 - 600 + 1),
+                'T' * len(intervals.z),
+                'ATCGATCG',
+                'T' * len(intervals.z),
+                'A' * (1499 - 1300 + 1),
+                'C' * len(intervals.w),
+                'A' * (1699 - 1600 + 1),
+                'G' * len(intervals.s),
+            ]
         )
         assert ft.seq == expt
         exons = [
@@ -542,7 +569,6 @@ class TestFusionTranscript:
             Exon(1509, 1608, strand=STRAND.POS),
             Exon(1709, 1808, strand=STRAND.POS),
         ]
-        print(ft.exons)
         for i in range(len(exons)):
             assert ft.exons[i].start == exons[i].start
             assert ft.exons[i].end == exons[i].end
@@ -567,18 +593,20 @@ class TestFusionTranscript:
         )
         ft = FusionTranscript.build(ann, ref)
 
-        expt = (
-            'C' * len(intervals.x)
-            + 'A' * (499 - 200 + 1)
-            + 'G' * len(intervals.y)
-            + 'A' * (1199 - 600 + 1)
-        )
-        expt += 'T' * len(intervals.z) + 'ATCGATCG' + 'T' * len(intervals.z)
-        expt += (
-            'A' * (1499 - 1300 + 1)
-            + 'C' * len(intervals.w)
-            + 'A' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.s)
+        expt = ''.join(
+            [
+                'C' * len(intervals.x),
+                'A' * (499 - 200 + 1),
+                'G' * len(intervals.y),
+                'A' * (1199 - 600 + 1),
+                'T' * len(intervals.z),
+                'ATCGATCG',
+                'T' * len(intervals.z),
+                'A' * (1499 - 1300 + 1),
+                'C' * len(intervals.w),
+                'A' * (1699 - 1600 + 1),
+                'G' * len(intervals.s),
+            ]
         )
         expt = reverse_complement(expt)
         assert ft.seq == expt
@@ -617,14 +645,17 @@ class TestFusionTranscript:
             bpp, transcript1=t1, transcript2=t2, event_type=SVTYPE.INV, protocol=PROTOCOL.GENOME
         )
         ft = FusionTranscript.build(ann, ref)
-        expt = (
-            'C' * len(intervals.x)
-            + 'A' * (499 - 200 + 1)
-            + 'G' * len(intervals.y)
-            + 'A' * (1199 - 600 + 1)
-        )
-        expt += (
-            'ATCGACTC' + 'G' * len(intervals.b) + 'T' * (2599 - 2100 + 1) + 'A' * len(intervals.a)
+        expt = ''.join(
+            [
+                'C' * len(intervals.x),
+                'A' * (499 - 200 + 1),
+                'G' * len(intervals.y),
+                'A' * (1199 - 600 + 1),
+                'ATCGACTC',
+                'G' * len(intervals.b),
+                'T' * (2599 - 2100 + 1),
+                'A' * len(intervals.a),
+            ]
         )
         assert ft.seq == expt
         assert len(ft.exons) == 4
@@ -654,14 +685,17 @@ class TestFusionTranscript:
             bpp, transcript1=t1, transcript2=t2, event_type=SVTYPE.INV, protocol=PROTOCOL.GENOME
         )
         ft = FusionTranscript.build(ann, ref)
-        expt = (
-            'T' * len(intervals.a) + 'A' * (2599 - 2100 + 1) + 'C' * len(intervals.b) + 'ATCGACTC'
-        )
-        expt += (
-            'T' * (1199 - 600 + 1)
-            + 'C' * len(intervals.y)
-            + 'T' * (499 - 200 + 1)
-            + 'G' * len(intervals.x)
+        expt = ''.join(
+            [
+                'T' * len(intervals.a),
+                'A' * (2599 - 2100 + 1),
+                'C' * len(intervals.b),
+                'ATCGACTC',
+                'T' * (1199 - 600 + 1),
+                'C' * len(intervals.y),
+                'T' * (499 - 200 + 1),
+                'G' * len(intervals.x),
+            ]
         )
 
         assert len(ft.exons) == 4
@@ -689,9 +723,19 @@ class TestFusionTranscript:
             bpp, transcript1=t1, transcript2=t2, event_type=SVTYPE.DUP, protocol=PROTOCOL.GENOME
         )
         ft = FusionTranscript.build(ann, ref)
-        expt = 'T' * len(intervals.a) + 'A' * (2599 - 2100 + 1) + 'C' * len(intervals.b) + 'ATCGAC'
-        expt += 'T' * len(intervals.z) + 'A' * (1499 - 1300 + 1) + 'C' * len(intervals.w)
-        expt += 'A' * (1699 - 1600 + 1) + 'G' * len(intervals.s)
+        expt = ''.join(
+            [
+                'T' * len(intervals.a),
+                'A' * (2599 - 2100 + 1),
+                'C' * len(intervals.b),
+                'ATCGAC',
+                'T' * len(intervals.z),
+                'A' * (1499 - 1300 + 1),
+                'C' * len(intervals.w),
+                'A' * (1699 - 1600 + 1),
+                'G' * len(intervals.s),
+            ]
+        )
 
         assert len(ft.exons) == 5
         assert ft.exon_number(ft.exons[1]) == 2
@@ -719,14 +763,19 @@ class TestFusionTranscript:
         )
         ft = FusionTranscript.build(ann, ref)
 
-        expt = (
-            'C' * len(intervals.s)
-            + 'T' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.w)
-            + 'T' * (1499 - 1300 + 1)
+        expt = ''.join(
+            [
+                'C' * len(intervals.s),
+                'T' * (1699 - 1600 + 1),
+                'G' * len(intervals.w),
+                'T' * (1499 - 1300 + 1),
+                'A' * len(intervals.z),
+                'GTCGAT',
+                'G' * len(intervals.b),
+                'T' * (2599 - 2100 + 1),
+                'A' * len(intervals.a),
+            ]
         )
-        expt += 'A' * len(intervals.z) + 'GTCGAT' + 'G' * len(intervals.b) + 'T' * (2599 - 2100 + 1)
-        expt += 'A' * len(intervals.a)
 
         assert len(ft.exons) == 5
         assert ft.exon_number(ft.exons[1]) == 2
@@ -754,18 +803,18 @@ class TestFusionTranscript:
         )
         ft = FusionTranscript.build(ann, ref)
 
-        expt = (
-            'C' * len(intervals.x)
-            + 'A' * (499 - 200 + 1)
-            + 'G' * len(intervals.y)
-            + 'A' * (1199 - 600 + 1)
-            + 'AACGTGT'
-        )
-        expt += (
-            'A' * (2999 - 2700 + 1)
-            + 'G' * len(intervals.c)
-            + 'A' * (3299 - 3100 + 1)
-            + 'T' * len(intervals.d)
+        expt = ''.join(
+            [
+                'C' * len(intervals.x),
+                'A' * (499 - 200 + 1),
+                'G' * len(intervals.y),
+                'A' * (1199 - 600 + 1),
+                'AACGTGT',
+                'A' * (2999 - 2700 + 1),
+                'G' * len(intervals.c),
+                'A' * (3299 - 3100 + 1),
+                'T' * len(intervals.d),
+            ]
         )
 
         assert ft.seq == expt
@@ -792,18 +841,18 @@ class TestFusionTranscript:
         )
         ft = FusionTranscript.build(ann, ref)
 
-        expt = (
-            'C' * len(intervals.x)
-            + 'A' * (499 - 200 + 1)
-            + 'G' * len(intervals.y)
-            + 'A' * (1199 - 600 + 1)
-            + 'AACGTGT'
-        )
-        expt += (
-            'A' * (2999 - 2700 + 1)
-            + 'G' * len(intervals.c)
-            + 'A' * (3299 - 3100 + 1)
-            + 'T' * len(intervals.d)
+        expt = ''.join(
+            [
+                'C' * len(intervals.x),
+                'A' * (499 - 200 + 1),
+                'G' * len(intervals.y),
+                'A' * (1199 - 600 + 1),
+                'AACGTGT',
+                'A' * (2999 - 2700 + 1),
+                'G' * len(intervals.c),
+                'A' * (3299 - 3100 + 1),
+                'T' * len(intervals.d),
+            ]
         )
 
         assert ft.seq == expt
@@ -822,8 +871,6 @@ class TestFusionTranscript:
         t2 = PreTranscript(
             exons=[intervals.a, intervals.b, intervals.c, intervals.d], strand=STRAND.NEG
         )
-        print('t1 exons', t1.exons)
-        print('t2 exons', t2.exons)
         b1 = Breakpoint(REF_CHR, 1200, orient=ORIENT.RIGHT)
         b2 = Breakpoint(REF_CHR, 2699, orient=ORIENT.LEFT)
         bpp = BreakpointPair(b1, b2, opposing_strands=False, untemplated_seq='AACGAGTGT')
@@ -834,16 +881,19 @@ class TestFusionTranscript:
 
         ft = FusionTranscript.build(ann, ref)
 
-        expt = (
-            'C' * len(intervals.s)
-            + 'T' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.w)
-            + 'T' * (1499 - 1300 + 1)
+        expt = ''.join(
+            [
+                'C' * len(intervals.s),
+                'T' * (1699 - 1600 + 1),
+                'G' * len(intervals.w),
+                'T' * (1499 - 1300 + 1),
+                'A' * len(intervals.z),
+                'ACACTCGTT',
+                'G' * len(intervals.b),
+                'T' * (2599 - 2100 + 1),
+                'A' * len(intervals.a),
+            ]
         )
-        expt += (
-            'A' * len(intervals.z) + 'ACACTCGTT' + 'G' * len(intervals.b) + 'T' * (2599 - 2100 + 1)
-        )
-        expt += 'A' * len(intervals.a)
 
         assert ft.seq == expt
         assert 5, len(ft.exons)
@@ -883,19 +933,21 @@ class TestFusionTranscript:
         assert ann.break1 == b1
         ft = FusionTranscript.build(ann, ref)
 
-        expt = (
-            'C' * len(intervals.x)
-            + 'A' * (499 - 200 + 1)
-            + 'G' * len(intervals.y)
-            + 'A' * (1199 - 600 + 1)
+        expt = ''.join(
+            [
+                'C' * len(intervals.x),
+                'A' * (499 - 200 + 1),
+                'G' * len(intervals.y),
+                'A' * (1199 - 600 + 1),
+                'GCAACATAT',
+                'C' * (1399 - 1200 + 1),
+                'A' * len(intervals.b4),
+                'C' * (1699 - 1500 + 1),
+                'G' * len(intervals.b5),
+                'C' * (2099 - 1800 + 1),
+                'A' * len(intervals.b6),
+            ]
         )
-        expt += (
-            'GCAACATAT'
-            + 'C' * (1399 - 1200 + 1)
-            + 'A' * len(intervals.b4)
-            + 'C' * (1699 - 1500 + 1)
-        )
-        expt += 'G' * len(intervals.b5) + 'C' * (2099 - 1800 + 1) + 'A' * len(intervals.b6)
 
         assert ft.seq == expt
         assert 5, len(ft.exons)
@@ -936,16 +988,21 @@ class TestFusionTranscript:
         assert ann.break2 == b2
         ft = FusionTranscript.build(ann, ref)
 
-        expt = (
-            'C' * len(intervals.s)
-            + 'T' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.w)
-            + 'T' * (1499 - 1300 + 1)
-        )
-        expt += (
-            'A' * len(intervals.z) + 'ATATGTAGA' + 'A' * len(intervals.b3) + 'G' * (1099 - 900 + 1)
+        expt = ''.join(
+            [
+                'C' * len(intervals.s),
+                'T' * (1699 - 1600 + 1),
+                'G' * len(intervals.w),
+                'T' * (1499 - 1300 + 1),
+                'A' * len(intervals.z),
+                'ATATGTAGA',
+                'A' * len(intervals.b3),
+                'G' * (1099 - 900 + 1),
+                'C' * len(intervals.b2),
+                'G' * (799 - 700 + 1),
+                'T' * len(intervals.b1),
+            ]
         )
-        expt += 'C' * len(intervals.b2) + 'G' * (799 - 700 + 1) + 'T' * len(intervals.b1)
 
         assert ft.seq == expt
         assert len(ft.exons) == 6
@@ -986,20 +1043,21 @@ class TestFusionTranscript:
         assert ann.break2 == b2
         ft = FusionTranscript.build(ann, ref)
 
-        expt = (
-            'C' * len(intervals.s)
-            + 'T' * (1699 - 1600 + 1)
-            + 'G' * len(intervals.w)
-            + 'T' * (1499 - 1300 + 1)
-        )
-        expt += (
-            'A' * len(intervals.z) + 'ATATGTATC' + 'C' * (1399 - 1200 + 1) + 'A' * len(intervals.b4)
-        )
-        expt += (
-            'C' * (1699 - 1500 + 1)
-            + 'G' * len(intervals.b5)
-            + 'C' * (2099 - 1800 + 1)
-            + 'A' * len(intervals.b6)
+        expt = ''.join(
+            [
+                'C' * len(intervals.s),
+                'T' * (1699 - 1600 + 1),
+                'G' * len(intervals.w),
+                'T' * (1499 - 1300 + 1),
+                'A' * len(intervals.z),
+                'ATATGTATC',
+                'C' * (1399 - 1200 + 1),
+                'A' * len(intervals.b4),
+                'C' * (1699 - 1500 + 1),
+                'G' * len(intervals.b5),
+                'C' * (2099 - 1800 + 1),
+                'A' * len(intervals.b6),
+            ]
         )
 
         assert ft.seq == expt
@@ -1119,6 +1177,11 @@ class TestSequenceFetching:
         ]
         assert mock_ann_obj.translation.get_aa_seq(REFERENCE_GENOME) == translate(cds)
 
+    def test_fetch_translation_aa_seq_after_cds_change(self, mock_ann_obj):
+        mock_ann_obj.translation.get_aa_seq(REFERENCE_GENOME)
+        mock_ann_obj.translation.seq = 'ATGGCCTGA'
+        assert mock_ann_obj.translation.get_aa_seq(REFERENCE_GENOME) == 'MA*'
+
     def test_fetch_translation_cds_seq_from_ref(self, mock_ann_obj):
         cds = mock_ann_obj.spliced_seq[
             mock_ann_obj.translation.start - 1 : mock_ann_obj.translation.end
@@ -1337,6 +1400,10 @@ class TestUSTranscript:
         with pytest.raises(AttributeError):
             PreTranscript(exons=[Exon(1, 15), Exon(10, 20)])
 
+    def test___init__overlapping_nested_exon_error(self):
+        with pytest.raises(AttributeError):
+            PreTranscript(exons=[Exon(1, 100), Exon(5, 10), Exon(50, 60)])
+
     def test_exon_number(self):
         t = PreTranscript(gene=None, exons=[(1, 99), (200, 299), (400, 499)], strand=STRAND.POS)
         for i, e in enumerate(t.exons):
@@ -1346,6 +1413,19 @@ class TestUSTranscript:
         for i, e in enumerate(sorted(t.exons, key=lambda x: x.start, reverse=True)):
             assert t.exon_number(e) == i + 1
 
+    def test_exon_number_reordered_exons(self):
+        t = PreTranscript(gene=None, exons=[(1, 99), (200, 299), (400, 499)], strand=STRAND.POS)
+        t.exons.reverse()
+        for i, e in enumerate(t.exons):
+            assert t.exon_number(e) == i + 1
+
+    def test_exon_number_not_associated_error(self):
+        t = PreTranscript(gene=None, exons=[(1, 99), (200, 299), (400, 499)], strand=STRAND.POS)
+        other = PreTranscript(gene=None, exons=[(250, 260), (600, 699)], strand=STRAND.POS)
+        for exon in other.exons:
+            with pytest.raises(AttributeError):
+                t.exon_number(exon)
+
 
 class TestDomain:
     def test___init__region_error(self):
@@ -1377,7 +1457,6 @@ class TestDomain:
             DomainRegion(481, 524, 'DIDECALPTGGHICSYRCINIPGSFQCSCPSSGYRLAPNGRNCQ'),
             DomainRegion(525, 578, 'DIDECVTGIHNCSINETCFNIQGGFRCLAFECPENYRRSAATLQQEKTDTVRCI'),
         ]
-        print(regions)
         refseq = (
             'MERAAPSRRVPLPLLLLGGLALLAAGVDADVLLEACCADGHRMATHQKDCSLPYATESKE'
             'CRMVQEQCCHSQLEELHCATGISLANEQDRCATPHGDNASLEATFVKRCCHCCLLGRAAQ'
@@ -1587,11 +1666,12 @@ class TestAnnotationGathering:
         assert dist == 50
         assert len(ann_list[1].encompassed_genes) == 2
 
+    @todo
     def test_interchromosomal(self):
-        raise unittest.SkipTest('TODO')
+        pass
 
+    @todo
     def test_intrachromosomal_within_gene_inversion(self):
-        raise unittest.SkipTest('TODO')
         g = Gene(REF_CHR, 1000, 3000, strand=STRAND.POS)
         t = PreTranscript(gene=g, exons=[(1001, 1100), (1501, 1600), (2001, 2100), (2501, 2600)])
         g.transcripts.append(t)
@@ -1634,7 +1714,6 @@ class TestAnnotate:
         first, second = ReferenceName('chr1'), ReferenceName('1')
         d = {first: 1}
         d[second] = 2
-        print(d)
         assert len(d) == 1
         d = {first: 1, second: 2}
         assert len(d) == 1
@@ -1756,8 +1835,6 @@ class TestAnnotateEvents:
         assert annotations[0].transcript2.get_strand() == STRAND.NEG
         assert annotations[0].transcript1.name == 'ENST00000375851'
         assert annotations[0].transcript2.name is None
-        for ann in annotations:
-            print(ann.transcript1, ann.transcript2)
         annotations = annotate_events(
             [bpp], reference_genome=REFERENCE_GENOME, annotations=reference_annotations
         )
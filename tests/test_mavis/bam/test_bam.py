@@ -4,12 +4,13 @@ from unittest import mock
 
 import pytest
 import timeout_decorator
-from mavis.annotate.file_io import load_annotations, load_reference_genome
+from mavis.annotate.file_io import load_annotations
 from mavis.bam import cigar as _cigar
 from mavis.bam import read as _read
 from mavis.bam.cache import BamCache
 from mavis.bam.read import (
     breakpoint_pos,
+    breakpoint_pos_or_none,
     orientation_supports_type,
     read_pair_type,
     sequenced_strand,
@@ -18,7 +19,7 @@ from mavis.bam.stats import Histogram, compute_genome_bam_stats, compute_transcr
 from mavis.constants import CIGAR, DNA_ALPHABET, ORIENT, READ_PAIR_TYPE, STRAND, SVTYPE
 from mavis.interval import Interval
 
-from ...util import get_data
+from ...util import get_data, get_mock_reference_genome
 from ..mock import MockBamFileHandle, MockRead
 
 REFERENCE_GENOME = None
@@ -27,7 +28,7 @@ REFERENCE_GENOME = None
 def setUpModule():
     warnings.simplefilter('ignore')
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
@@ -169,6 +170,32 @@ class TestModule:
             r = MockRead(reference_start=10, cigar=[(CIGAR.X, 10), (CIGAR.M, 10)])
             _read.breakpoint_pos(r, ORIENT.LEFT)
 
+    def test_breakpoint_pos_or_none(self):
+        # ==========+++++++++>
+        r = MockRead(reference_start=10, cigar=[(CIGAR.M, 10), (CIGAR.S, 10)])
+        assert breakpoint_pos_or_none(r) == 19
+        assert breakpoint_pos_or_none(r, ORIENT.LEFT) == 19
+        assert breakpoint_pos_or_none(r, ORIENT.RIGHT) is None
+
+        # ++++++++++=========>
+        r = MockRead(reference_start=10, cigar=[(CIGAR.S, 10), (CIGAR.M, 10)])
+        assert breakpoint_pos_or_none(r) == 10
+        assert breakpoint_pos_or_none(r, ORIENT.LEFT) is None
+        assert breakpoint_pos_or_none(r, ORIENT.RIGHT) == 10
+
+        # +++++=========+++++++++>
+        r = MockRead(reference_start=10, cigar=[(CIGAR.S, 5), (CIGAR.M, 10), (CIGAR.S, 10)])
+        assert breakpoint_pos_or_none(r) == 19
+        assert breakpoint_pos_or_none(r, ORIENT.LEFT) == 19
+        assert breakpoint_pos_or_none(r, ORIENT.RIGHT) == 10
+
+        # ====================>
+        r = MockRead(reference_start=10, cigar=[(CIGAR.X, 10), (CIGAR.M, 10)])
+        for orient in [ORIENT.NS, ORIENT.LEFT, ORIENT.RIGHT]:
+            assert breakpoint_pos_or_none(r, orient) is None
+            with pytest.raises(AttributeError):
+                breakpoint_pos(r, orient)
+
     def test_nsb_align(self):
         ref = (
             'GATTCTTTCCTGTTTGGTTCCTGGTCGTGAGTGGCAGGTGCCATCATGTTTCATTCTGCCTGAGAGCAGTCTACCTAAATATATAGCTCTGCTCACAG'
@@ -430,6 +457,15 @@ class TestHistogram:
         h.add(11)
         assert h.median() == 6
 
+    def test_median_weighted(self):
+        h = Histogram()
+        h.add(10, 3)
+        h.add(1)
+        h.add(20, 2)
+        assert h.median() == 10
+        h.add(30, 2)
+        assert h.median() == 15
+
     def test_distib_stderr(self):
         h = Histogram()
         for i in range(0, 11):
@@ -2,7 +2,6 @@ import warnings
 
 import pytest
 import timeout_decorator
-from mavis.annotate.file_io import load_reference_genome
 from mavis.bam import read as _read
 from mavis.bam.cigar import (
     alignment_matches,
@@ -21,7 +20,7 @@ from mavis.bam.cigar import (
 from mavis.bam.read import SamRead
 from mavis.constants import CIGAR
 
-from ...util import get_data
+from ...util import get_mock_reference_genome
 from ..mock import MockObject, MockRead
 
 REFERENCE_GENOME = None
@@ -30,7 +29,7 @@ REFERENCE_GENOME = None
 def setUpModule():
     warnings.simplefilter('ignore')
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
@@ -1,11 +1,10 @@
-import unittest
-
 import pytest
 from mavis.constants import COLUMNS, ORIENT, STRAND, SVTYPE
 from mavis.convert import SUPPORTED_TOOL, _convert_tool_row, _parse_transabyss
 from mavis.convert.vcf import convert_record as _parse_vcf_record
 from mavis.convert.vcf import parse_bnd_alt as _parse_bnd_alt
 
+from ...util import todo
 from ..mock import Mock
 
 
@@ -233,8 +232,9 @@ class TestTransAbyss:
         assert bpp.opposing_strands is False
         assert bpp.untemplated_seq == ''
 
+    @todo
     def test_convert_translocation(self):
-        raise unittest.SkipTest('TODO')
+        pass
 
     def test_convert_stranded_translocation(self):
         row = {
@@ -1,11 +1,11 @@
-import unittest
-
 import pytest
 from mavis.annotate.genomic import PreTranscript
 from mavis.breakpoint import Breakpoint, BreakpointPair
 from mavis.constants import CALL_METHOD, COLUMNS, ORIENT, PROTOCOL, STRAND, SVTYPE
 from mavis.pairing import pairing
 
+from ...util import todo
+
 
 @pytest.fixture
 def genomic_event1():
@@ -308,21 +308,25 @@ class TestPairing:
         assert pairing.inferred_equivalent(genome_ev, trans_ev, transcripts)
         assert pairing.inferred_equivalent(trans_ev, genome_ev, transcripts)
 
+    @todo
     def test_mixed_protocol_both_predicted(self):
+        pass
 
-        raise unittest.SkipTest('TODO')
-
+    @todo
     def test_mixed_protocol_neither_predicted_one_match(self):
-        raise unittest.SkipTest('TODO')
+        pass
 
+    @todo
     def test_mixed_protocol_neither_predicted_no_match(self):
-        raise unittest.SkipTest('TODO')
+        pass
 
+    @todo
     def test_mixed_protocol_neither_predicted_both_match(self):
-        raise unittest.SkipTest('TODO')
+        pass
 
+    @todo
     def test_transcriptome_protocol(self):
-        raise unittest.SkipTest('TODO')
+        pass
 
 
 @pytest.fixture
@@ -2,7 +2,6 @@ from unittest import mock
 
 import mavis.bam.cigar as _cigar
 from mavis import align
-from mavis.annotate.file_io import load_reference_genome
 from mavis.assemble import Contig
 from mavis.bam.cache import BamCache
 from mavis.bam.read import SamRead
@@ -12,7 +11,7 @@ from mavis.interval import Interval
 from mavis.validate.evidence import GenomeEvidence
 from mavis_config import DEFAULTS
 
-from ..util import blat_only, bwa_only, get_data
+from ..util import blat_only, bwa_only, get_data, get_mock_reference_genome
 from .mock import MockLongString, MockObject, MockRead
 
 REFERENCE_GENOME = None
@@ -20,7 +19,7 @@ REFERENCE_GENOME = None
 
 def setUpModule():
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
@@ -1,13 +1,12 @@
 from functools import partial
 
 import pytest
-from mavis.annotate.file_io import load_reference_genome
 from mavis.breakpoint import Breakpoint, BreakpointPair
 from mavis.constants import ORIENT, STRAND
 from mavis.interval import Interval
 from mavis.validate.evidence import TranscriptomeEvidence
 
-from ..util import get_data
+from ..util import get_mock_reference_genome
 from .mock import MockObject, get_example_genes
 
 REFERENCE_GENOME = None
@@ -16,7 +15,7 @@ REF_CHR = 'fake'
 
 def setUpModule():
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME[REF_CHR].seq[0:50].upper()
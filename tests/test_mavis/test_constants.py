@@ -1,3 +1,4 @@
+import pytest
 from mavis.constants import COLUMNS, ORIENT, STRAND, reverse_complement, sort_columns, translate
 
 
@@ -21,6 +22,9 @@ class TestConstants:
     def test_reverse_complement(self):
         assert reverse_complement('CGAT') == 'ATCG'
         assert reverse_complement('') == ''
+        assert reverse_complement('acgtNRYkm') == 'kmRYNacgt'
+        with pytest.raises(ValueError):
+            reverse_complement('AC-GT')
 
     def test_translate(self):
         seq = 'ATG' 'AAT' 'TCT' 'GGA' 'TGA'
@@ -31,6 +35,9 @@ class TestConstants:
         translated_seq = translate(seq, 2)
         assert translated_seq == 'EFWM'  # AT GAA TTC TGG ATG A
 
+    def test_translate_ambiguous(self):
+        assert translate('ATGNNNGCNtga') == 'MXA*'
+
     def test_sort_columns(self):
         temp = ['NEW', 'NEW2', COLUMNS.break1_seq, COLUMNS.break2_seq, COLUMNS.break1_chromosome]
         assert sort_columns(temp) == [
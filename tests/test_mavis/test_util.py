@@ -77,6 +77,29 @@ class TestReadBreakpointPairsFromFile:
             for b in bpps:
                 print(b)
 
+    def test_missing_chromosome_error(self, tmp_path):
+        input_file = tmp_path / "inputs.tsv"
+        input_file.write_text(
+            mock_file_content(
+                {
+                    COLUMNS.break1_chromosome: '1',
+                    COLUMNS.break1_position_start: 1,
+                    COLUMNS.break1_position_end: 1,
+                    COLUMNS.break1_strand: STRAND.NS,
+                    COLUMNS.break1_orientation: ORIENT.LEFT,
+                    COLUMNS.break2_chromosome: '',
+                    COLUMNS.break2_position_start: 10,
+                    COLUMNS.break2_position_end: 10,
+                    COLUMNS.break2_strand: STRAND.NS,
+                    COLUMNS.break2_orientation: ORIENT.RIGHT,
+                    COLUMNS.stranded: False,
+                    COLUMNS.opposing_strands: False,
+                }
+            )
+        )
+        with pytest.raises(TypeError, match='missing chromosome'):
+            read_bpp_from_input_file(input_file)
+
     def test_stranded_no_expand_error(self, tmp_path):
         input_file = tmp_path / "inputs.tsv"
         input_file.write_text(
@@ -2,7 +2,6 @@ from unittest import mock
 
 import pytest
 from mavis.align import call_paired_read_event, select_contig_alignments
-from mavis.annotate.file_io import load_reference_genome
 from mavis.annotate.genomic import PreTranscript, Transcript
 from mavis.bam import cigar as _cigar
 from mavis.bam.cache import BamCache
@@ -15,7 +14,7 @@ from mavis.validate import call
 from mavis.validate.base import Evidence
 from mavis.validate.evidence import GenomeEvidence, TranscriptomeEvidence
 
-from ...util import get_data, todo
+from ...util import get_data, get_mock_reference_genome, todo
 from ..mock import MockBamFileHandle, MockLongString, MockRead, get_example_genes, mock_read_pair
 
 REFERENCE_GENOME = None
@@ -23,7 +22,7 @@ REFERENCE_GENOME = None
 
 def setUpModule():
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
@@ -1227,6 +1226,48 @@ class TestCallBySupportingReads:
         b2 = set([read.query_name for read in event.break2_split_reads])
         assert len(b1 & b2) == 1
 
+    def test_insertion_size_estimate_for_each_second_position(self):
+        evidence = GenomeEvidence(
+            Breakpoint('fake', 50, 150, orient=ORIENT.LEFT),
+            Breakpoint('fake', 100, 350, orient=ORIENT.RIGHT),
+            BamCache(MockBamFileHandle()),
+            None,
+            opposing_strands=False,
+            read_length=100,
+            stdev_fragment_size=25,
+            median_fragment_size=400,
+            config={
+                'validate.stdev_count_abnormal': 2,
+                'validate.min_splits_reads_resolution': 1,
+                'validate.min_linking_split_reads': 1,
+                'validate.min_double_aligned_to_estimate_insertion_size': 1,
+                'validate.min_softclipping': 10,
+            },
+        )
+        for name, seq, second_start in [('r1', 'A' * 100, 149), ('r2', 'C' * 100, 299)]:
+            evidence.split_reads[0].add(
+                MockRead(
+                    query_name=name,
+                    reference_start=50,
+                    cigar=[(CIGAR.EQ, 50), (CIGAR.S, 50)],
+                    query_sequence=seq,
+                )
+            )
+            evidence.split_reads[1].add(
+                MockRead(
+                    query_name=name,
+                    reference_start=second_start,
+                    cigar=[(CIGAR.S, 50), (CIGAR.EQ, 50)],
+                    query_sequence=seq,
+                )
+            )
+        # the second pair is further apart than an insertion could span within a single read
+        with mock.patch.object(call, 'EventCall', side_effect=ValueError) as event_call:
+            call._call_by_split_reads(evidence, SVTYPE.INS)
+        assert {(c.args[0].start, c.args[1].start) for c in event_call.call_args_list} == {
+            (100, 150)
+        }
+
 
 @pytest.fixture
 def left_right_ev():
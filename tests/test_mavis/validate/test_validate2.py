@@ -1,5 +1,4 @@
 import pytest
-from mavis.annotate.file_io import load_reference_genome
 from mavis.bam import cigar as _cigar
 from mavis.bam.cache import BamCache
 from mavis.bam.read import SamRead
@@ -9,7 +8,7 @@ from mavis.validate.base import Evidence
 from mavis.validate.evidence import GenomeEvidence
 from mavis_config import DEFAULTS
 
-from ...util import get_data, long_running_test
+from ...util import get_data, get_mock_reference_genome, long_running_test
 from ..mock import MockLongString, MockObject, MockRead, mock_read_pair
 
 REFERENCE_GENOME = None
@@ -17,7 +16,7 @@ REFERENCE_GENOME = None
 
 def setUpModule():
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
@@ -3,17 +3,16 @@ import shutil
 import tempfile
 
 import pytest
-from mavis.annotate.file_io import load_reference_genome
 from mavis.breakpoint import Breakpoint, BreakpointPair
 from mavis.constants import ORIENT, SVTYPE
 from tools.calculate_ref_alt_counts import RefAltCalculator
 
-from ..util import get_data, glob_exists
+from ..util import get_data, get_mock_reference_genome, glob_exists
 
 
 def setUpModule():
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
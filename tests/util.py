@@ -1,8 +1,10 @@
+import functools
 import glob
 import os
 import shutil
 
 import pytest
+from mavis.annotate.file_io import load_reference_genome
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
 
@@ -25,6 +27,15 @@ def get_data(*paths):
     return os.path.join(DATA_DIR, *paths)
 
 
+@functools.lru_cache(maxsize=None)
+def get_mock_reference_genome():
+    """
+    parse the mock reference genome once per test session and share it between modules. Tests
+    must treat the returned genome as read-only
+    """
+    return load_reference_genome(get_data('mock_reference_genome.fa'))
+
+
 def glob_exists(*pos, strict=False, n=1):
     globexpr = os.path.join(*pos)
     file_list = glob.glob(globexpr)